@@ -0,0 +1,160 @@
+"""
+Performance budgets - measures per-page transfer weight of generated pages
+Separation: Logic only, reads built files from disk, no HTML generation
+"""
+
+import re
+from pathlib import Path
+from urllib.parse import unquote, urljoin, urlsplit
+
+
+# Resources a browser fetches while loading a page
+SRC_PATTERN = re.compile(r"""<(img|iframe|script|source|video|audio)\b[^>]*?\bsrc=['"]([^'"]+)['"]""", re.IGNORECASE)
+LINK_PATTERN = re.compile(r"""<link\b[^>]*?\bhref=['"]([^'"]+)['"]""", re.IGNORECASE)
+URL_PATTERN = re.compile(r"""url\(\s*['"]?([^'")]+?)['"]?\s*\)""")
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif", ".svg"}
+FONT_EXTENSIONS = {".woff", ".woff2", ".ttf", ".otf", ".eot"}
+
+# Default budgets in kB; override per site in site-data.json "site.budgets"
+# and per page in the page's own "budgets" object.
+DEFAULT_BUDGETS = {
+    "total_kb": {"warn": 1500, "fail": 8000},
+    "images_kb": {"warn": 1000, "fail": 7500},
+    "html_kb": {"warn": 100, "fail": 500},
+}
+
+
+def classify(path: str, tag: str = "") -> str:
+    """Classify a referenced resource as html/css/js/image/font/iframe/other."""
+    suffix = Path(urlsplit(path).path).suffix.lower()
+    if tag == "iframe":
+        return "iframe"
+    if tag == "script" or suffix == ".js":
+        return "js"
+    if suffix == ".css":
+        return "css"
+    if suffix in IMAGE_EXTENSIONS or tag == "img":
+        return "image"
+    if suffix in FONT_EXTENSIONS:
+        return "font"
+    return "other"
+
+
+def find_references(text: str) -> list:
+    """Return (kind, url) tuples for every resource referenced in HTML/CSS text."""
+    refs = [(classify(url, tag.lower()), url) for tag, url in SRC_PATTERN.findall(text)]
+    refs += [(classify(url), url) for url in LINK_PATTERN.findall(text)]
+    refs += [(classify(url), url) for url in URL_PATTERN.findall(text)]
+    return [(kind, url) for kind, url in refs if url.strip() and not url.startswith("data:")]
+
+
+def resolve_reference(base_url: str, ref: str):
+    """
+    Resolve a reference against the referring file's site URL.
+    Returns the site-relative path, or None for external resources.
+    Uses URL semantics, so '../' above the site root clamps to '/'.
+    """
+    resolved = urlsplit(urljoin(base_url, ref))
+    if resolved.scheme or resolved.netloc:
+        return None
+    return unquote(resolved.path).lstrip("/")
+
+
+def measure_page(page_file: Path, site_root: Path, size_cache: dict = None) -> dict:
+    """
+    Measure the cold-cache transfer weight of one built page.
+    Each distinct local resource is counted once; CSS files are scanned
+    for their own url() references. External resources are only counted.
+    """
+    if size_cache is None:
+        size_cache = {}
+
+    def file_size(rel_path: str):
+        if rel_path not in size_cache:
+            target = site_root / rel_path
+            size_cache[rel_path] = target.stat().st_size if target.is_file() else None
+        return size_cache[rel_path]
+
+    page_rel = page_file.relative_to(site_root).as_posix()
+    weights = {"html": page_file.stat().st_size, "css": 0, "js": 0, "image": 0, "font": 0, "iframe": 0, "other": 0}
+    external = set()
+    missing = set()
+    seen = set()
+
+    pending = [("/" + page_rel, page_file.read_text(encoding="utf-8"))]
+    while pending:
+        base_url, text = pending.pop()
+        for kind, ref in find_references(text):
+            rel_path = resolve_reference(base_url, ref)
+            if rel_path is None:
+                external.add(ref)
+                continue
+            if rel_path in seen:
+                continue
+            seen.add(rel_path)
+
+            size = file_size(rel_path)
+            if size is None:
+                missing.add(rel_path)
+                continue
+            weights[kind] += size
+            if kind == "css":
+                pending.append(("/" + rel_path, (site_root / rel_path).read_text(encoding="utf-8")))
+
+    return {
+        "page": page_rel,
+        "total": sum(weights.values()),
+        "weights": weights,
+        "external": sorted(external),
+        "missing": sorted(missing),
+    }
+
+
+def get_budgets(site_budgets: dict, page_budgets: dict) -> dict:
+    """Merge default, site-wide and per-page budgets (all in kB)."""
+    budgets = {name: dict(limits) for name, limits in DEFAULT_BUDGETS.items()}
+    for overrides in (site_budgets, page_budgets):
+        for name, limits in overrides.items():
+            budgets.setdefault(name, {}).update(limits)
+    return budgets
+
+
+def check_budgets(measurement: dict, budgets: dict) -> list:
+    """Return (level, message) tuples for every exceeded budget."""
+    actual_kb = {
+        "total_kb": measurement["total"] / 1024,
+        "images_kb": measurement["weights"]["image"] / 1024,
+        "html_kb": measurement["weights"]["html"] / 1024,
+    }
+    problems = []
+    for name, limits in budgets.items():
+        if name not in actual_kb:
+            raise ValueError(f"Unknown budget '{name}' (known: {', '.join(sorted(actual_kb))})")
+        value = actual_kb[name]
+        for level in ("fail", "warn"):
+            limit = limits.get(level)
+            if limit is not None and value > limit:
+                problems.append((level, f"{name} {value:.0f} kB > {level} budget {limit} kB"))
+                break
+    for rel_path in measurement["missing"]:
+        problems.append(("warn", f"missing file {rel_path}"))
+    return problems
+
+
+def format_report(results: list) -> str:
+    """Format (measurement, problems) pairs as a table ranked by total weight."""
+    columns = [("html", "html"), ("css", "css"), ("js", "js"), ("image", "img"), ("font", "font"), ("iframe", "iframe")]
+    header = "".join(f" {label:>8}" for _, label in columns)
+    lines = [f"  {'page':<54} {'total':>9}{header} {'ext':>4}"]
+    for measurement, problems in sorted(results, key=lambda r: r[0]["total"], reverse=True):
+        w = measurement["weights"]
+        cells = "".join(f" {w[kind] / 1024:>6.0f}kB" for kind, _ in columns)
+        lines.append(
+            f"  {measurement['page']:<54} {measurement['total'] / 1024:>7.0f}kB{cells}"
+            f" {len(measurement['external']):>4}"
+        )
+        for level, message in problems:
+            marker = "✗" if level == "fail" else "⚠"
+            lines.append(f"      {marker} {message}")
+    return "\n".join(lines)
@@ -8,47 +8,231 @@ ARCHITECTURE LAYERS:
   3. build.py (this)   → Orchestration and file I/O
 
 Data flow: JSON → page_builder (logic) → metadata dict → html_generator (render) → file I/O
+
+Output goes to dist/: the generated HTML plus only the media and assets it
+references, staged by hardlink/reflink (see staging.py). dist/ is a
+complete, deployable tree.
 """
 
+import argparse
 import json
+import re
+import sys
 from pathlib import Path
 
 # Import logic layer
-from page_builder import build_page_metadata, get_output_file
+from page_builder import (
+    build_page_metadata, apply_placeholders, get_output_file, get_last_updated, select_pages,
+    get_page_path, get_root_path, is_home_page
+)
+from site_model import parse_site, SiteDataError
+
+# Import budget checks (reads built files)
+from budget import measure_page, get_budgets, check_budgets, format_report
+
+# Import image placeholders (reads media files)
+import placeholders
+
+# Import output staging (links referenced media into dist/)
+from staging import stage_files, prune_output
 
 # Import rendering layer
-from html_generator import render_complete_page
+from html_generator import render_complete_page, render_page_fragments, SECTION_RENDERERS, CONTENT_LAYOUTS
+from templates import COLUMN_RENDERERS, render_navbar
 
 # Configuration
 SITE_ROOT = Path(__file__).parent.parent
 SRC_DIR = SITE_ROOT / "src"
-OUTPUT_DIR = SITE_ROOT
+OUTPUT_DIR = SITE_ROOT / "dist"
+PLACEHOLDER_CACHE = SRC_DIR / ".placeholder-cache.json"
+
+# Inline style attributes are rejected - styling belongs in assets/styles.css.
+# Only per-image hero backgrounds may be set inline.
+INLINE_STYLE_PATTERN = re.compile(r"""\sstyle\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+ALLOWED_INLINE_STYLE = re.compile(r"^background-image:\s*url\([^)]*\)(?:,\s*url\([^)]*\))*;?$")
+
+SITE_DATA_FILE = SRC_DIR / "site-data.json"
+
+
+def load_site():
+    """
+    Read site-data.json and parse it, validated against the registered
+    section/column types. Only the model is kept; the raw JSON is released
+    as soon as it has been parsed.
+    """
+    with open(SITE_DATA_FILE, encoding="utf-8") as f:
+        data = json.load(f)
+    return parse_site(
+        data,
+        # "fragment" sections are created by page_builder, never written by hand
+        section_types=set(SECTION_RENDERERS) - {"fragment"},
+        column_types=COLUMN_RENDERERS,
+        layouts=CONTENT_LAYOUTS,
+    )
+
+
+def find_inline_styles(html_content: str) -> list:
+    """Return every inline style attribute that is not explicitly allowed."""
+    styles = [double or single for double, single in INLINE_STYLE_PATTERN.findall(html_content)]
+    return [style for style in styles if not ALLOWED_INLINE_STYLE.match(style.strip())]
+
+
+def find_stale_navigation(pages: dict, page_ids: list) -> list:
+    """
+    Return ids of pages outside page_ids whose built file is missing or has
+    a different navbar than the current page set and titles would render.
+    """
+    selected = set(page_ids)
+    stale = []
+    for page_id in pages:
+        if page_id in selected:
+            continue
+        output_file = get_output_file(page_id, OUTPUT_DIR)
+        navbar = render_navbar(pages, get_root_path(get_page_path(page_id)), is_home_page(page_id))
+        if not output_file.is_file() or navbar not in output_file.read_text(encoding="utf-8"):
+            stale.append(page_id)
+    return stale
+
+
+def build_image_placeholders(page_ids: list, pages: dict, prune: bool) -> dict:
+    """Compute LQIP placeholders for images on the selected site_model pages (src → placeholder entry)."""
+    if not placeholders.is_available():
+        print("  ⚠ Pillow not installed - building without image placeholders")
+        return {}
+    sources = placeholders.collect_image_sources([pages[page_id] for page_id in page_ids])
+    result, stats, failures = placeholders.build_placeholders(sources, SITE_ROOT, PLACEHOLDER_CACHE, prune)
+    print(
+        f"  ✓ Image placeholders: {stats['cached']} cached, {stats['computed']} computed,"
+        f" {stats['missing']} missing, {stats['failed']} failed"
+    )
+    for src, error in sorted(failures.items()):
+        print(f"  ⚠ No placeholder for {src}: {error}")
+    return result
+
+
+def write_gallery_manifests(manifests: dict) -> list:
+    """Write paginated gallery manifests (site-relative path → JSON data)."""
+    written = []
+    for rel_path, data in manifests.items():
+        manifest_file = OUTPUT_DIR / rel_path
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(manifest_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        written.append(manifest_file)
+        print(f"  ✓ Generated {manifest_file.relative_to(SITE_ROOT)}")
+    return written
 
-# Load site data once
-with open(SRC_DIR / "site-data.json", encoding="utf-8") as f:
-    SITE_DATA = json.load(f)
 
+def write_fragments(output_file: Path, fragments: dict) -> list:
+    """Write lazily loaded section bodies next to their page."""
+    written = []
+    for name, fragment_html in fragments.items():
+        fragment_file = output_file.parent / name
+        with open(fragment_file, "w", encoding="utf-8") as f:
+            f.write(fragment_html)
+        written.append(fragment_file)
+        print(f"  ✓ Generated {fragment_file.relative_to(SITE_ROOT)}")
+    return written
 
-def build_site():
+
+def stage_output(generated: set, prune: bool) -> None:
+    """Link referenced media/assets into the output tree; prune leftovers on full builds."""
+    staged, stats = stage_files(generated, SITE_ROOT, OUTPUT_DIR)
+    summary = ", ".join(f"{count} {method}" for method, count in sorted(stats.items()))
+    print(f"  ✓ Staged {len(staged)} files ({summary or 'none'})")
+    if prune:
+        removed = prune_output(OUTPUT_DIR, generated | staged)
+        if removed:
+            print(f"  ✓ Removed {removed} stale files from {OUTPUT_DIR.relative_to(SITE_ROOT)}/")
+
+
+def check_page_budgets(built: list, site) -> bool:
     """
-    Build entire site by orchestrating the three layers:
+    Print a page weight report for the built pages, ranked by size.
+    Returns False if any page exceeds a "fail" budget.
+    """
+    print("📊 Page weight (cold cache):")
+    results = []
+    size_cache = {}
+    for page_id, output_file in built:
+        measurement = measure_page(output_file, OUTPUT_DIR, size_cache)
+        budgets = get_budgets(site.budgets, site.pages[page_id].budgets)
+        results.append((measurement, check_budgets(measurement, budgets)))
+    print(format_report(results))
+    return not any(level == "fail" for _, problems in results for level, _ in problems)
+
+
+def build_site(patterns: list = None):
+    """
+    Build the site by orchestrating the three layers.
+    
+    patterns: optional page ids / globs (see page_builder.select_pages) to
+    limit which pages are written. The navbar is always rendered from the
+    full page set, so partial builds produce the same HTML as a full build.
+    If the page set or a title changed, the navbar of every other page is
+    stale too, so the build falls back to building all pages.
+    
+    Site data is parsed and validated once up front (site_model.parse_site);
+    malformed content fails the build with its JSON path.
     
-    For each page:
-      1. Load page data from SITE_DATA
-      2. Call page_builder.build_page_metadata() → get pure logic metadata dict
+    For each selected page:
+      1. Take the site_model.Page
+      2. Call page_builder.build_page_metadata() → get pure logic PageContext
       3. Call html_generator.render_complete_page() → get HTML string
-      4. Write to file
+      4. Write to file, plus gallery manifests and lazy section fragments
+    
+    Then stage referenced media/assets into OUTPUT_DIR and check budgets.
     """
     print("🏗️  Building Løvel website...")
     
-    pages = SITE_DATA["pages"]
+    try:
+        site = load_site()
+    except (SiteDataError, json.JSONDecodeError) as e:
+        print(f"❌ site-data.json: {e}")
+        return False
+    
+    pages = site.pages
+    errors = []
     
-    for page_id, page_data in pages.items():
+    try:
+        page_ids = select_pages(list(pages), patterns)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return False
+    
+    if patterns:
+        stale = find_stale_navigation(pages, page_ids)
+        if stale:
+            print(f"  ⚠ Navigation changed (page set or titles), {stale[0]} is out of date - building all pages")
+            patterns = None
+            page_ids = list(pages)
+        else:
+            print(f"  Building {len(page_ids)} of {len(pages)} pages")
+    
+    apply_placeholders(site, build_image_placeholders(page_ids, pages, prune=not patterns))
+    last_updated = get_last_updated()
+    built = []
+    generated = set()
+    
+    for page_id in page_ids:
         # LOGIC LAYER: Build metadata (pure logic, no HTML)
-        metadata = build_page_metadata(page_id, page_data, SITE_DATA)
+        metadata = build_page_metadata(pages[page_id], last_updated)
         
         # RENDERING LAYER: Generate HTML from metadata
-        html_content = render_complete_page(metadata, pages)
+        try:
+            html_content = render_complete_page(metadata, pages)
+            fragments = render_page_fragments(metadata)
+        except ValueError as e:
+            errors.append(f"{page_id}: {e}")
+            print(f"  ✗ {page_id}: {e}")
+            continue
+        
+        inline_styles = find_inline_styles(html_content + "".join(fragments.values()))
+        if inline_styles:
+            message = f"inline style not allowed, use a class in assets/styles.css: style='{inline_styles[0]}'"
+            errors.append(f"{page_id}: {message}")
+            print(f"  ✗ {page_id}: {message}")
+            continue
         
         # FILE I/O LAYER: Determine output path and write
         output_file = get_output_file(page_id, OUTPUT_DIR)
@@ -57,10 +241,37 @@ def build_site():
         with open(output_file, "w", encoding="utf-8") as f:
             f.write(html_content)
         
+        built.append((page_id, output_file))
+        generated.add(output_file)
         print(f"  ✓ Generated {output_file.relative_to(SITE_ROOT)}")
+        
+        generated.update(write_gallery_manifests(metadata.gallery_manifests))
+        generated.update(write_fragments(output_file, fragments))
+    
+    # Only a complete, error-free build may delete files from the output tree
+    stage_output(generated, prune=not patterns and not errors)
+    
+    if not check_page_budgets(built, site):
+        errors.append("performance budget exceeded")
+    
+    if errors:
+        print(f"❌ Build failed with {len(errors)} error(s)")
+        return False
     
     print("✅ Build complete!")
+    return True
+
+
+def main(argv: list = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Build the Løvel website.")
+    parser.add_argument(
+        "pages", nargs="*",
+        help="page ids, globs or subtrees to build, e.g. foreninger/luif 'informationer/*' (default: all)"
+    )
+    args = parser.parse_args(argv)
+    return 0 if build_site(args.pages) else 1
 
 
 if __name__ == "__main__":
-    build_site()
+    sys.exit(main())
@@ -5,86 +5,100 @@ Separation: Only HTML markup, no logic/orchestration
 
 from templates import (
     render_header, render_text_section, render_two_column_section,
-    render_navbar
+    render_single_column_section, render_navbar, render_video_column,
+    render_slider, render_gallery
 )
 
 
-def render_section(section: dict, root_path: str, parent_collapsible_id: str = None) -> str:
+def render_header_section(section, root_path: str, parent_collapsible_id: str = None) -> str:
+    """Render a header section (optionally a collapsible toggle)."""
+    return render_header(section.title, section.collapsible, section.id)
+
+
+def render_text_type_section(section, root_path: str, parent_collapsible_id: str = None) -> str:
+    """Render a text section, collapsed under its parent header if any."""
+    return render_text_section(
+        section.text,
+        is_collapsible=section.collapsible or bool(parent_collapsible_id),
+        section_id=parent_collapsible_id or section.id
+    )
+
+
+def render_content_section(section, root_path: str, parent_collapsible_id: str = None) -> str:
+    """Render a content section in its single- or two-column layout."""
+    renderer = CONTENT_LAYOUTS.get(section.layout)
+    if renderer is None:
+        raise ValueError(f"Unknown content layout '{section.layout}' (known: {', '.join(sorted(CONTENT_LAYOUTS))})")
+    return renderer(section.columns, root_path, section.collapsible, section.id)
+
+
+def render_video_section(section, root_path: str, parent_collapsible_id: str = None) -> str:
+    """Render a full-width YouTube video section."""
+    return f"<div class='section'><div class='container'><div class='row cols-1'><div class='col'>" + render_video_column(section.video_id) + "</div></div></div></div>\n"
+
+
+def render_slider_section(section, root_path: str, parent_collapsible_id: str = None) -> str:
+    """Render an image slider section."""
+    return f"<div class='section'><div class='container'>" + render_slider(section.images, root_path, section.autoplay, section.slider_id or "slider") + "</div></div>\n"
+
+
+def render_gallery_section(section, root_path: str, parent_collapsible_id: str = None) -> str:
+    """Render an image gallery section."""
+    return f"<div class='section'><div class='container'>" + render_gallery(section.images, root_path, section.manifest, section.gallery_id or "gallery") + "</div></div>\n"
+
+
+def render_fragment_section(section, root_path: str, parent_collapsible_id: str = None) -> str:
+    """
+    Render the placeholder for a lazily loaded run of collapsed sections
+    (see page_builder.defer_collapsed_sections). The body is fetched from
+    `src` on first expand. The noscript link follows the placeholder rather
+    than sitting inside it, because collapsed content is never shown
+    without JS.
     """
-    Dispatch section rendering to appropriate template.
-    Pure HTML generation based on section data.
+    return (
+        f"<div class='section collapsible-content collapsed lazy-section' data-section='{section.id}' data-fragment='{section.src}'></div>\n"
+        f"<noscript><div class='section'><div class='container'><a href='{section.src}'>{section.title}</a></div></div></noscript>\n"
+    )
+
+
+# Content layout → renderer(columns, root_path, is_collapsible, section_id)
+CONTENT_LAYOUTS = {
+    "single": render_single_column_section,
+    "two-col": render_two_column_section,
+}
+
+# Section type → renderer(section: site_model.Section, root_path, parent_collapsible_id).
+# Add new section types with register_section_type().
+SECTION_RENDERERS = {
+    "header": render_header_section,
+    "text": render_text_type_section,
+    "content": render_content_section,
+    "video": render_video_section,
+    "slider": render_slider_section,
+    "gallery": render_gallery_section,
+    "fragment": render_fragment_section,
+}
+
+
+def register_section_type(section_type: str, renderer) -> None:
+    """Register a renderer(section, root_path, parent_collapsible_id) -> str."""
+    SECTION_RENDERERS[section_type] = renderer
+
+
+def render_section(section, root_path: str, parent_collapsible_id: str = None) -> str:
+    """
+    Dispatch a Section model to the registered renderer for its type.
+    Unknown types raise ValueError so the build fails instead of dropping content.
     
     parent_collapsible_id: If set, this section is content under a collapsible header
     """
-    section_type = section.get("type")
-    is_collapsible = section.get("collapsible", False)
-    section_id = section.get("id", "")
-    
-    if section_type == "header":
-        return render_header(section.get('title', ''), is_collapsible, section_id)
-    
-    elif section_type == "text":
-        return render_text_section(
-            content=section.get('content'),
-            title=section.get('title'),
-            paragraphs=section.get('paragraphs'),
-            bullets=section.get('bullets'),
-            is_collapsible=is_collapsible or bool(parent_collapsible_id),
-            section_id=parent_collapsible_id or section_id
-        )
-    
-    elif section_type == "content":
-        layout = section.get("layout", "single")
-        columns = section.get("columns", [])
-        
-        if layout == "two-col":
-            return render_two_column_section(columns, root_path, is_collapsible, section_id)
-        else:
-            # Single column layout
-            from templates import render_iframe_column, render_map_column, render_image_column, render_text_column
-            html = f"<div class='section'><div class='container'>"
-            for col in columns:
-                col_type = col.get("type")
-                if col_type == "text":
-                    html += render_text_column(
-                        content=col.get("content"),
-                        title=col.get("title"),
-                        paragraphs=col.get("paragraphs"),
-                        bullets=col.get("bullets")
-                    )
-                elif col_type == "iframe":
-                    html += render_iframe_column(col.get("src", ""), col.get("alt", ""))
-                elif col_type == "map":
-                    html += render_map_column(col.get("src", ""), col.get("alt", ""))
-                elif col_type == "image":
-                    html += render_image_column(col.get("src", ""), root_path, col.get("alt", ""))
-            html += "</div></div>\n"
-            return html
-    
-    elif section_type == "video":
-        video_id = section.get("video_id", "")
-        if video_id:
-            from templates import render_video_column
-            return f"<div class='section'><div class='container'><div class='row cols-1'><div class='col'>" + render_video_column(video_id) + "</div></div></div></div>\n"
-    
-    elif section_type == "slider":
-        images = section.get("images", [])
-        if images:
-            from templates import render_slider
-            slider_html = render_slider(images, root_path)
-            return f"<div class='section'><div class='container'>" + slider_html + "</div></div>\n"
-    
-    elif section_type == "gallery":
-        images = section.get("images", [])
-        if images:
-            from templates import render_gallery
-            gallery_html = render_gallery(images, root_path)
-            return f"<div class='section'><div class='container'>" + gallery_html + "</div></div>\n"
-    
-    return ""
+    renderer = SECTION_RENDERERS.get(section.type)
+    if renderer is None:
+        raise ValueError(f"Unknown section type '{section.type}' (known: {', '.join(sorted(SECTION_RENDERERS))})")
+    return renderer(section, root_path, parent_collapsible_id)
 
 
-def render_page_head(metadata: dict) -> str:
+def render_page_head(metadata) -> str:
     """Generate HTML head section."""
     return f"""<!DOCTYPE html>
 <html lang="da">
@@ -93,67 +107,82 @@ def render_page_head(metadata: dict) -> str:
     <meta http-equiv="X-UA-Compatible" content="IE=edge">
     <meta name="viewport" content="width=device-width, initial-scale=1">
     <meta name="robots" content="index, follow">
-    <meta name="description" content="{metadata['description']}">
-    <title>{metadata['title']} - Løvel - lige i nærheden</title>
+    <meta name="description" content="{metadata.description}">
+    <title>{metadata.title} - Løvel - lige i nærheden</title>
     <link href="https://fonts.googleapis.com/css?family=Source+Sans+Pro:400,700" rel="stylesheet">
-    <link href="{metadata['css_path']}" rel="stylesheet">
+    <link href="{metadata.css_path}" rel="stylesheet">
 </head>
 <body>"""
 
 
-def render_page_navbar(pages: dict, metadata: dict) -> str:
+def render_page_navbar(pages: dict, metadata) -> str:
     """Generate navigation bar."""
-    return render_navbar(pages, metadata['root_path'], metadata['is_home'])
+    return render_navbar(pages, metadata.root_path, metadata.is_home)
 
 
-def render_page_hero(metadata: dict) -> str:
+def render_page_hero(metadata) -> str:
     """Generate hero section if applicable."""
-    if not metadata['has_hero']:
+    if not metadata.has_hero:
         return ""
     
-    hero = metadata['hero']
-    return f"""    <div class="hero" style="background-image: url('{metadata['root_path']}{hero.get('image', '')}');">
+    hero = metadata.hero
+    # The placeholder is a second background layer shown until the image loads
+    placeholder = f", url('{hero.placeholder}')" if hero.placeholder else ""
+    return f"""    <div class="hero" style="background-image: url('{metadata.root_path}{hero.image}'){placeholder};">
         <div class="container">
-            <h1>{hero.get('title', '')}</h1>
-            <h3>{hero.get('subtitle', '')}</h3>
+            <h1>{hero.title}</h1>
+            <h3>{hero.subtitle}</h3>
         </div>
     </div>
 """
 
 
-def render_page_main(metadata: dict) -> str:
+def render_page_main(metadata) -> str:
     """Generate main content sections."""
     html = "    <main>\n"
     html += render_page_hero(metadata)
     
     # Add sections - with collapsible logic
-    sections = metadata['sections']
+    sections = metadata.sections
     current_collapsible_id = None
     
     for section in sections:
-        section_type = section.get("type")
-        
         # If this is a collapsible header, remember its ID for next sections
-        if section_type == "header" and section.get("collapsible") and section.get("id"):
-            current_collapsible_id = section.get("id")
-            html += render_section(section, metadata['root_path'])
+        if section.type == "header" and section.collapsible and section.id:
+            current_collapsible_id = section.id
+            html += render_section(section, metadata.root_path)
         # If this is another header, clear the collapsible context
-        elif section_type == "header":
+        elif section.type == "header":
             current_collapsible_id = None
-            html += render_section(section, metadata['root_path'])
+            html += render_section(section, metadata.root_path)
         # All other sections after a collapsible header get the parent ID
         else:
-            html += render_section(section, metadata['root_path'], parent_collapsible_id=current_collapsible_id)
+            html += render_section(section, metadata.root_path, parent_collapsible_id=current_collapsible_id)
             # Keep the collapsible context for following sections until next header
     
     html += "    </main>\n"
     return html
 
 
-def render_page_footer(metadata: dict) -> str:
+def render_page_fragments(metadata) -> dict:
+    """
+    Render the bodies of lazily loaded sections.
+    Returns {file name: HTML}; files live next to the page's own HTML file.
+    """
+    fragments = {}
+    for section in metadata.sections:
+        if section.type == "fragment":
+            fragments[section.src] = "".join(
+                render_section(body, metadata.root_path, parent_collapsible_id=section.id)
+                for body in section.sections
+            )
+    return fragments
+
+
+def render_page_footer(metadata) -> str:
     """Generate footer section."""
-    root_path = metadata['root_path']
-    last_updated = metadata['last_updated']
+    root_path = metadata.root_path
+    last_updated = metadata.last_updated
     
     return f"""
     <button id="scrollToTop" aria-label="Tilbage til toppen">↑</button>
@@ -175,9 +204,78 @@ def render_page_footer(metadata: dict) -> str:
 """
 
 
-def render_page_scripts() -> str:
-    """Generate JavaScript code."""
-    return """
+# Collapsible toggle handler body for pages whose collapsed sections are all inline
+COLLAPSE_TOGGLE_SCRIPT = """
+                // Toggle header itself
+                header.classList.toggle('collapsed');
+                this.setAttribute('aria-expanded', header.classList.contains('collapsed') ? 'true' : 'false');
+                
+                sectionContents(header, sectionId).forEach(el => el.classList.toggle('collapsed'));
+            });
+
+"""
+
+# Lazy pages (page_builder.defer_collapsed_sections): fetch a run's fragments
+# before toggling it
+LAZY_COLLAPSE_TOGGLE_SCRIPT = """
+                // Ignore further clicks until the fragments are in, so each
+                // click toggles exactly once
+                if (header.dataset.loading) return;
+                header.dataset.loading = 'true';
+                
+                const lazy = sectionContents(header, sectionId).filter(el => el.classList.contains('lazy-section'));
+                Promise.all(lazy.map(loadFragment)).then(() => {
+                    delete header.dataset.loading;
+                    
+                    // Force layout so freshly inserted sections animate open
+                    void header.offsetHeight;
+                    
+                    // Toggle header itself
+                    header.classList.toggle('collapsed');
+                    this.setAttribute('aria-expanded', header.classList.contains('collapsed') ? 'true' : 'false');
+                    
+                    sectionContents(header, sectionId).forEach(el => el.classList.toggle('collapsed'));
+                });
+            });
+
+"""
+
+# Loads fragment files; only shipped on pages that have fragment sections
+FRAGMENT_LOADER_SCRIPT = """
+        // Replace a lazy-section placeholder with its prebuilt fragment.
+        // One request per placeholder, however often this is called.
+        function loadFragment(placeholder) {
+            if (!placeholder.loading) {
+                placeholder.loading = fetch(placeholder.dataset.fragment)
+                    .then(response => {
+                        if (!response.ok) throw new Error(response.status);
+                        return response.text();
+                    })
+                    .then(html => {
+                        const template = document.createElement('template');
+                        template.innerHTML = html;
+                        placeholder.replaceWith(template.content);
+                    })
+                    .catch(() => {
+                        // Fall back to the link in the noscript that follows the placeholder
+                        const noscript = placeholder.nextElementSibling;
+                        placeholder.classList.remove('lazy-section');
+                        if (noscript && noscript.tagName === 'NOSCRIPT') placeholder.innerHTML = noscript.textContent;
+                    });
+            }
+            return placeholder.loading;
+        }
+        
+"""
+
+
+def render_page_scripts(metadata) -> str:
+    """
+    Generate JavaScript code. The fragment loader is only included when the
+    page has lazily loaded sections.
+    """
+    lazy = any(section.type == "fragment" for section in metadata.sections)
+    return ("""
     <script>
         // Scroll to top button
         const scrollToTopBtn = document.getElementById('scrollToTop');
@@ -218,7 +316,38 @@ def render_page_scripts() -> str:
             }
         });
 
+        // Image placeholders: hide the blurred preview once the real image has
+        // loaded (load events don't bubble, so listen in the capture phase;
+        // this also covers images inserted later by galleries and fragments)
+        function revealImage(img) {
+            const box = img.closest('.has-lqip');
+            if (box && !img.classList.contains('lqip')) box.classList.add('lqip-loaded');
+        }
+        document.addEventListener('load', event => {
+            if (event.target.tagName === 'IMG') revealImage(event.target);
+        }, true);
+        document.querySelectorAll('.has-lqip img:not(.lqip)').forEach(img => {
+            if (img.complete) revealImage(img);
+        });
+
         // Collapsible sections
+        function sectionContents(header, sectionId) {
+            // All consecutive content sections with the same ID, up to the next header
+            const contents = [];
+            let nextElement = header.nextElementSibling;
+            while (nextElement && !nextElement.classList.contains('collapsible-header')) {
+                if (nextElement.classList.contains('collapsible-content') && 
+                    nextElement.getAttribute('data-section') === sectionId) {
+                    contents.push(nextElement);
+                }
+                nextElement = nextElement.nextElementSibling;
+            }
+            return contents;
+        }
+        
+"""
+        + (FRAGMENT_LOADER_SCRIPT if lazy else "")
+        + """
         document.querySelectorAll('.collapse-toggle').forEach(toggle => {
             toggle.addEventListener('click', function() {
                 const header = this.closest('.collapsible-header');
@@ -227,26 +356,9 @@ def render_page_scripts() -> str:
                 const sectionId = header.getAttribute('data-section');
                 if (!sectionId) return;
                 
-                // Toggle header itself
-                header.classList.toggle('collapsed');
-                this.setAttribute('aria-expanded', header.classList.contains('collapsed') ? 'true' : 'false');
-                
-                // Find and toggle ALL consecutive content sections with the same ID
-                let nextElement = header.nextElementSibling;
-                while (nextElement) {
-                    if (nextElement.classList.contains('collapsible-content') && 
-                        nextElement.getAttribute('data-section') === sectionId) {
-                        nextElement.classList.toggle('collapsed');
-                        nextElement = nextElement.nextElementSibling;
-                    } else if (nextElement.classList.contains('collapsible-header')) {
-                        // Stop when we hit the next header
-                        break;
-                    } else {
-                        nextElement = nextElement.nextElementSibling;
-                    }
-                }
-            });
-
+"""
+        + (LAZY_COLLAPSE_TOGGLE_SCRIPT if lazy else COLLAPSE_TOGGLE_SCRIPT)
+        + """
             // Handle keyboard Enter/Space
             toggle.addEventListener('keydown', function(e) {
                 if (e.key === 'Enter' || e.key === ' ') {
@@ -257,17 +369,19 @@ def render_page_scripts() -> str:
         });
     </script>
 </body>
-</html>"""
+</html>""")
 
 
-def render_complete_page(metadata: dict, pages: dict) -> str:
+def render_complete_page(metadata, pages: dict) -> str:
     """
     Assemble complete HTML page from components.
     Pure HTML generation - orchestration handled by caller.
+    
+    metadata: page_builder.PageContext; pages: page id → site_model.Page (for the navbar)
     """
     html = render_page_head(metadata)
     html += render_page_navbar(pages, metadata)
     html += render_page_main(metadata)
     html += render_page_footer(metadata)
-    html += render_page_scripts()
+    html += render_page_scripts(metadata)
     return html
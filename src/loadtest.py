@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Load test - replays a realistic page + asset request mix against the site
+
+Each simulated visit fetches one built page and then every local resource
+it loads (stylesheets, scripts, images, including url() references in CSS),
+the way a browser does. A share of visits are repeat visits with a warm
+cache: like a browser, they reuse responses that are still fresh per their
+Cache-Control max-age without any request, and revalidate no-cache or
+expired ones with If-None-Match.
+Pages are picked with PAGE_WEIGHTS so the front page dominates like it does
+in real traffic.
+
+Without --url an in-process preview server (serve.py) is started on a free
+port, so `python3 loadtest.py` after a build needs no other setup.
+
+Usage: python3 loadtest.py [--url http://127.0.0.1:8000] [--duration 10] [--concurrency 8]
+"""
+
+import argparse
+import http.client
+import random
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+from budget import find_references, resolve_reference
+from serve import DIST_DIR, create_server
+
+# Relative visit frequency per built page (default 1)
+PAGE_WEIGHTS = {
+    "index.html": 6,
+    "medier.html": 2,
+    "foreninger/luif/index.html": 2,
+}
+ACCEPT_ENCODING = "br, gzip"
+
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def freshness_lifetime(cache_control: str) -> float:
+    """Seconds a response may be reused without revalidation (0 = revalidate every time)."""
+    cache_control = (cache_control or "").lower()
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return 0
+    match = MAX_AGE_PATTERN.search(cache_control)
+    return int(match.group(1)) if match else 0
+
+
+def plan_visits(site_dir: Path) -> list:
+    """
+    Return (weight, page_url, asset_urls) for every built page.
+    Lazy-section fragments are skipped; they are fetched on demand only.
+    """
+    visits = []
+    for page_file in sorted(site_dir.rglob("*.html")):
+        rel_path = page_file.relative_to(site_dir).as_posix()
+        if ".section-" in page_file.name:
+            continue
+        assets = []
+        seen = set()
+        pending = [("/" + rel_path, page_file.read_text(encoding="utf-8"))]
+        while pending:
+            base_url, text = pending.pop()
+            for kind, ref in find_references(text):
+                asset = resolve_reference(base_url, ref)
+                if asset is None or asset in seen or kind == "iframe":
+                    continue
+                seen.add(asset)
+                assets.append("/" + quote(asset))
+                if kind == "css" and (site_dir / asset).is_file():
+                    pending.append(("/" + asset, (site_dir / asset).read_text(encoding="utf-8")))
+        # Browsers request /foreninger/luif/, not /foreninger/luif/index.html
+        page_url = "/" + quote(rel_path.removesuffix("index.html"))
+        visits.append((PAGE_WEIGHTS.get(rel_path, 1), page_url, assets))
+    return visits
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, round(pct / 100 * len(values)) - 1))
+    return values[index]
+
+
+class Worker(threading.Thread):
+    """One simulated browser with a keep-alive connection and its own HTTP cache."""
+
+    def __init__(self, host: str, port: int, visits: list, deadline: float, repeat_ratio: float, seed: int):
+        super().__init__(daemon=True)
+        self.host = host
+        self.port = port
+        self.visits = visits
+        self.weights = [weight for weight, _, _ in visits]
+        self.deadline = deadline
+        self.repeat_ratio = repeat_ratio
+        self.random = random.Random(seed)
+        # url → (ETag, time until which the response is fresh)
+        self.cache = {}
+        # (kind, status, seconds, bytes) per request
+        self.samples = []
+        # Fresh responses reused without a request
+        self.cache_hits = 0
+        self.errors = 0
+
+    def connect(self):
+        return http.client.HTTPConnection(self.host, self.port, timeout=10)
+
+    def run(self):
+        conn = self.connect()
+        while time.perf_counter() < self.deadline:
+            _, page_url, assets = self.random.choices(self.visits, self.weights)[0]
+            # A repeat visitor keeps its cache; a new one starts cold
+            if self.random.random() >= self.repeat_ratio:
+                self.cache.clear()
+            for kind, url in [("page", page_url)] + [("asset", url) for url in assets]:
+                try:
+                    self.fetch(conn, kind, url)
+                except (OSError, http.client.HTTPException):
+                    self.errors += 1
+                    conn.close()
+                    conn = self.connect()
+        conn.close()
+
+    def fetch(self, conn, kind: str, url: str):
+        headers = {"Accept-Encoding": ACCEPT_ENCODING}
+        etag, fresh_until = self.cache.get(url, (None, 0))
+        if time.perf_counter() < fresh_until:
+            self.cache_hits += 1
+            return
+        if etag:
+            headers["If-None-Match"] = etag
+        start = time.perf_counter()
+        conn.request("GET", url, headers=headers)
+        response = conn.getresponse()
+        body = response.read()
+        elapsed = time.perf_counter() - start
+        if response.getheader("ETag"):
+            lifetime = freshness_lifetime(response.getheader("Cache-Control"))
+            self.cache[url] = (response.getheader("ETag"), time.perf_counter() + lifetime)
+        self.samples.append((kind, response.status, elapsed, len(body)))
+
+
+def run_load_test(host: str, port: int, visits: list, duration: float, concurrency: int,
+                  repeat_ratio: float, seed: int = 0) -> dict:
+    """Run the load test and return aggregated results."""
+    deadline = time.perf_counter() + duration
+    workers = [Worker(host, port, visits, deadline, repeat_ratio, seed + i) for i in range(concurrency)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    samples = [sample for worker in workers for sample in worker.samples]
+    statuses = {}
+    for _, status, _, _ in samples:
+        statuses[status] = statuses.get(status, 0) + 1
+    latencies = {
+        kind: sorted(seconds for k, _, seconds, _ in samples if kind in (k, "all"))
+        for kind in ("all", "page", "asset")
+    }
+    return {
+        "elapsed": elapsed,
+        "requests": len(samples),
+        "visits": sum(1 for kind, _, _, _ in samples if kind == "page"),
+        "bytes": sum(size for _, _, _, size in samples),
+        "cache_hits": sum(worker.cache_hits for worker in workers),
+        "errors": sum(worker.errors for worker in workers),
+        "statuses": statuses,
+        "latencies": latencies,
+    }
+
+
+def format_results(results: dict) -> str:
+    """Format load test results as a short report."""
+    elapsed = results["elapsed"]
+    lines = [
+        f"  {results['requests']} requests ({results['visits']} page visits) in {elapsed:.1f}s",
+        f"  throughput: {results['requests'] / elapsed:.0f} req/s, {results['visits'] / elapsed:.1f} visits/s,"
+        f" {results['bytes'] / elapsed / 1024 / 1024:.1f} MB/s",
+        f"  transferred: {results['bytes'] / 1024 / 1024:.1f} MB",
+        f"  browser cache: {results['cache_hits']} fresh responses reused without a request",
+        "  status: " + ", ".join(f"{status}×{count}" for status, count in sorted(results["statuses"].items())),
+        f"  {'latency':<8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}",
+    ]
+    for kind, values in results["latencies"].items():
+        cells = [percentile(values, pct) * 1000 for pct in (50, 90, 99, 100)]
+        lines.append(f"  {kind:<8}" + "".join(f" {ms:>6.1f}ms" for ms in cells))
+    if results["errors"]:
+        lines.append(f"  ✗ {results['errors']} failed requests")
+    return "\n".join(lines)
+
+
+def main(argv: list = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Replay a realistic page + asset request mix against the site.")
+    parser.add_argument("--url", help="running server to test (default: start a preview server for --dir)")
+    parser.add_argument("--dir", type=Path, default=DIST_DIR, help="built site used to plan requests (default: dist/)")
+    parser.add_argument("--duration", type=float, default=10, help="seconds to run (default: 10)")
+    parser.add_argument("--concurrency", type=int, default=8, help="simulated browsers (default: 8)")
+    parser.add_argument("--repeat-ratio", type=float, default=0.5,
+                        help="share of visits with a warm browser cache (default: 0.5)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if not (args.dir / "index.html").is_file():
+        print(f"❌ No built site in {args.dir} - run python3 build.py first")
+        return 1
+    visits = plan_visits(args.dir)
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        server = create_server(args.dir, 0, quiet=True)
+        host, port = server.server_address[:2]
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print(f"🔥 {len(visits)} pages, {args.concurrency} clients, {args.duration:.0f}s against http://{host}:{port}/")
+    try:
+        results = run_load_test(host, port, visits, args.duration, args.concurrency, args.repeat_ratio, args.seed)
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+
+    print(format_results(results))
+    return 1 if results["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
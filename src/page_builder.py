@@ -3,9 +3,18 @@ Page builder logic - orchestrates data and generates page structure
 Separation: Logic only, no HTML generation
 """
 
+from copy import copy
 from datetime import datetime
+from fnmatch import fnmatchcase
 from pathlib import Path
 
+from site_model import Page, Section, Site
+
+# Galleries larger than this are paginated: the first page is rendered into
+# the HTML, the rest is served from JSON manifests (override with "page_size").
+GALLERY_PAGE_SIZE = 24
+GALLERY_MANIFEST_DIR = "assets/galleries"
+
 
 def get_root_path(page_path: str) -> str:
     """Get relative path to root from current page."""
@@ -37,36 +46,230 @@ def get_last_updated() -> str:
     return datetime.now().strftime("%d. %B %Y")
 
 
-def build_page_metadata(page_id: str, page_data: dict, site_data: dict) -> dict:
+def apply_placeholders(site: Site, placeholders: dict) -> None:
+    """
+    Set the LQIP data URI and display size (placeholders.compute_placeholder
+    results by src) on every hero, image column and gallery image that has one.
+    """
+    for page in site.pages.values():
+        if page.hero and page.hero.image in placeholders:
+            page.hero.placeholder = placeholders[page.hero.image]["placeholder"]
+        for section in page.sections:
+            for item in [section] + section.columns:
+                targets = [item] if item.type == "image" else item.images
+                for target in targets:
+                    entry = placeholders.get(target.src)
+                    if entry:
+                        target.placeholder = entry["placeholder"]
+                        target.image_size = (entry["width"], entry["height"])
+
+
+def manifest_image(img) -> dict:
+    """JSON entry for one gallery image in a manifest."""
+    entry = {"src": img.src, "alt": img.alt}
+    if img.placeholder:
+        entry["placeholder"] = img.placeholder
+    if img.image_size:
+        entry["width"], entry["height"] = img.image_size
+    return entry
+
+
+def paginate_gallery(gallery, gallery_id: str) -> tuple:
+    """
+    Split a gallery section/column into its first page and JSON manifests.
+    Returns (gallery, manifests): gallery is a copy with `gallery_id` set,
+    and for galleries larger than one page `images` cut to the first page
+    and `manifest` set for the renderer; manifests maps site-relative file
+    paths to their JSON data.
+    """
+    paginated = copy(gallery)
+    paginated.gallery_id = gallery_id
+    images = gallery.images
+    page_size = gallery.page_size or GALLERY_PAGE_SIZE
+    if len(images) <= page_size:
+        return paginated, {}
+    
+    pages = [images[i:i + page_size] for i in range(0, len(images), page_size)]
+    manifest_dir = f"{GALLERY_MANIFEST_DIR}/{gallery_id}"
+    manifests = {}
+    for number, page_images in enumerate(pages[1:], start=2):
+        manifests[f"{manifest_dir}/page-{number}.json"] = {
+            "page": number,
+            "pages": len(pages),
+            "total": len(images),
+            "images": [manifest_image(img) for img in page_images],
+        }
+    
+    paginated.images = pages[0]
+    paginated.manifest = {
+        "url": f"{manifest_dir}/page-{{page}}.json",
+        "pages": len(pages),
+        "total": len(images),
+    }
+    return paginated, manifests
+
+
+def paginate_galleries(page_id: str, sections: list) -> tuple:
+    """
+    Give every gallery on a page (gallery sections and gallery columns) a
+    site-wide unique id, "<page slug>-gallery-<n>", and paginate it.
+    The id names both its manifest directory and its DOM elements; the
+    section `id` is not used because collapsible groups share it.
+    Returns (sections, manifests) without mutating the input.
+    """
+    slug = page_id.replace("/", "-")
+    manifests = {}
+    counter = 0
+    
+    def paginate(gallery):
+        nonlocal counter
+        counter += 1
+        paginated, gallery_manifests = paginate_gallery(gallery, f"{slug}-gallery-{counter}")
+        manifests.update(gallery_manifests)
+        return paginated
+    
+    result = []
+    for section in sections:
+        if section.type == "gallery":
+            section = paginate(section)
+        elif any(col.type == "gallery" for col in section.columns):
+            section = copy(section)
+            section.columns = [paginate(col) if col.type == "gallery" else col for col in section.columns]
+        result.append(section)
+    return result, manifests
+
+
+def number_sliders(page_id: str, sections: list) -> list:
+    """
+    Give every slider section on a page a unique id, "<page slug>-slider-<n>",
+    so several sliders can share a page. Returns new sections without
+    mutating the input.
+    """
+    slug = page_id.replace("/", "-")
+    result = []
+    counter = 0
+    for section in sections:
+        if section.type == "slider":
+            counter += 1
+            section = copy(section)
+            section.slider_id = f"{slug}-slider-{counter}"
+        result.append(section)
+    return result
+
+
+def has_inline_script(section: Section) -> bool:
+    """Whether a section renders its own <script> (galleries and sliders)."""
+    script_types = ("gallery", "slider")
+    return section.type in script_types or any(col.type in script_types for col in section.columns)
+
+
+def defer_collapsed_sections(page_id: str, sections: list) -> list:
+    """
+    Lazy mode: replace each run of collapsed sections under a collapsible
+    header with a "fragment" section. The renderer emits a placeholder and
+    build.py writes the run to a fragment file next to the page, named by
+    `src`, so relative paths inside it resolve exactly as on the page.
+    Sections with inline scripts stay in the page (inserted scripts don't run).
+    """
+    stem = "index" if "/" in page_id or is_home_page(page_id) else page_id
+    result = []
+    runs = {}
+    header_id = None
+    header_title = ""
+    
+    for section in sections:
+        if section.type == "header":
+            header_id = section.id if section.collapsible else None
+            header_title = section.title
+            result.append(section)
+            continue
+        
+        # Same rule as the renderers: text follows its header, content is
+        # only collapsed when it carries the header's id; other section
+        # types are never rendered collapsed, so they stay in the page
+        is_collapsed = header_id and (
+            section.type == "text"
+            or (section.type == "content" and section.collapsible and section.id == header_id)
+        )
+        if not is_collapsed or has_inline_script(section):
+            result.append(section)
+            continue
+        
+        previous = result[-1] if result else None
+        if previous and previous.type == "fragment" and previous.id == header_id:
+            previous.sections.append(section)
+            continue
+        
+        runs[header_id] = runs.get(header_id, 0) + 1
+        suffix = f"-{runs[header_id]}" if runs[header_id] > 1 else ""
+        fragment = Section("fragment")
+        fragment.id = header_id
+        fragment.title = header_title
+        fragment.src = f"{stem}.section-{header_id}{suffix}.html"
+        fragment.sections = [section]
+        result.append(fragment)
+    return result
+
+
+class PageContext:
+    """Everything html_generator needs to render one page."""
+    __slots__ = (
+        "page_id", "page_path", "root_path", "is_home", "css_path", "title",
+        "description", "has_hero", "hero", "sections", "gallery_manifests",
+        "last_updated",
+    )
+
+
+def build_page_metadata(page: Page, last_updated: str = None) -> PageContext:
     """
     Build all metadata needed for page rendering.
     Pure data transformation - no HTML.
     """
-    page_path = get_page_path(page_id)
-    root_path = get_root_path(page_path)
-    is_home = is_home_page(page_id)
+    metadata = PageContext()
+    metadata.page_id = page.id
+    metadata.page_path = get_page_path(page.id)
+    metadata.root_path = get_root_path(metadata.page_path)
+    metadata.is_home = is_home_page(page.id)
+    metadata.css_path = get_css_path(page.id, metadata.root_path)
+    metadata.title = page.title
+    metadata.description = page.description
+    metadata.has_hero = metadata.is_home and page.hero is not None
+    metadata.hero = page.hero
     
-    return {
-        "page_id": page_id,
-        "page_path": page_path,
-        "root_path": root_path,
-        "is_home": is_home,
-        "css_path": get_css_path(page_id, root_path),
-        "title": page_data.get("title", ""),
-        "description": page_data.get("description", site_data['site']['description']),
-        "has_hero": is_home and "hero" in page_data,
-        "hero": page_data.get("hero", {}),
-        "sections": page_data.get("sections", []),
-        "last_updated": get_last_updated(),
-    }
+    sections, metadata.gallery_manifests = paginate_galleries(page.id, page.sections)
+    sections = number_sliders(page.id, sections)
+    if page.lazy_sections:
+        sections = defer_collapsed_sections(page.id, sections)
+    metadata.sections = sections
+    metadata.last_updated = last_updated or get_last_updated()
+    return metadata
+
+
+def select_pages(page_ids: list, patterns: list) -> list:
+    """
+    Filter page ids by CLI patterns, preserving site-data order.
+    A pattern matches an exact page id, a glob ('informationer/*') or a
+    subtree prefix ('foreninger' matches every 'foreninger/...' page).
+    Raises ValueError for patterns that match nothing.
+    """
+    if not patterns:
+        return list(page_ids)
+    
+    selected = set()
+    for pattern in patterns:
+        prefix = pattern.rstrip("/") + "/"
+        matches = [pid for pid in page_ids if fnmatchcase(pid, pattern) or pid.startswith(prefix)]
+        if not matches:
+            raise ValueError(f"No pages match '{pattern}'")
+        selected.update(matches)
+    
+    return [pid for pid in page_ids if pid in selected]
 
 
 def get_output_file(page_id: str, output_dir: Path) -> Path:
     """Determine output file path for page."""
     if "/" in page_id:
-        page_dir = output_dir / page_id
-        page_dir.mkdir(parents=True, exist_ok=True)
-        return page_dir / "index.html"
+        return output_dir / page_id / "index.html"
     elif page_id == "home":
         return output_dir / "index.html"
     else:
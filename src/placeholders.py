@@ -0,0 +1,144 @@
+"""
+Low-quality image placeholders (LQIP) - tiny blurred previews of page images
+Separation: Logic only, reads media files, no HTML generation
+
+Placeholders are small JPEG data URIs, cached by the SHA-256 of the source
+file and computed in a process pool, together with each image's display
+size so the page can reserve its box. Images with transparency get no
+placeholder (a preview would show through their transparent areas).
+Requires Pillow; without it the build simply renders images without
+placeholders.
+"""
+
+import base64
+import hashlib
+import io
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+
+PLACEHOLDER_SIZE = 16  # longest side in pixels
+PLACEHOLDER_QUALITY = 50
+CACHE_VERSION = 2
+# Vector images scale without a preview and Pillow cannot read them
+VECTOR_EXTENSIONS = {".svg"}
+
+
+def is_available() -> bool:
+    """Whether placeholders can be generated (Pillow is installed)."""
+    return Image is not None
+
+
+def collect_image_sources(pages: list) -> set:
+    """Return every site-relative image path used by hero, image and gallery content of site_model.Page objects."""
+    sources = set()
+    for page in pages:
+        if page.hero:
+            sources.add(page.hero.image)
+        for section in page.sections:
+            for item in [section] + section.columns:
+                if item.type == "image":
+                    sources.add(item.src)
+                elif item.type == "gallery":
+                    sources.update(img.src for img in item.images)
+    return sources
+
+
+def has_transparency(img) -> bool:
+    """Whether any pixel of the image is not fully opaque."""
+    if img.mode not in ("RGBA", "LA", "PA") and "transparency" not in img.info:
+        return False
+    return img.convert("RGBA").getchannel("A").getextrema()[0] < 255
+
+
+def compute_placeholder(image_file: str) -> dict:
+    """
+    Measure one image and downscale it to a tiny JPEG data URI.
+    Returns {"placeholder", "width", "height"}; the size is as displayed
+    (EXIF orientation applied) and placeholder is "" for transparent images.
+    """
+    with Image.open(image_file) as img:
+        img = ImageOps.exif_transpose(img)
+        width, height = img.size
+        if has_transparency(img):
+            return {"placeholder": "", "width": width, "height": height}
+        img = img.convert("RGB")
+        img.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=PLACEHOLDER_QUALITY, optimize=True)
+    placeholder = "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+    return {"placeholder": placeholder, "width": width, "height": height}
+
+
+def try_compute_placeholder(image_file: str) -> tuple:
+    """compute_placeholder() returning (result, None), or (None, error message) for unreadable images."""
+    try:
+        return compute_placeholder(image_file), None
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        return None, str(e) or type(e).__name__
+
+
+def load_cache(cache_file: Path) -> dict:
+    """Load the hash → placeholder cache, ignoring stale or unreadable caches."""
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != CACHE_VERSION:
+        return {}
+    return cache.get("placeholders", {})
+
+
+def build_placeholders(sources: set, site_root: Path, cache_file: Path, prune: bool = True) -> tuple:
+    """
+    Compute placeholders for the given image sources.
+    Returns (placeholders, stats, failures): placeholders maps src →
+    compute_placeholder() result, stats counts cached/computed/missing/failed
+    images and failures maps src → error for images Pillow cannot read (they
+    are rendered without placeholder). Vector images (SVG) are skipped. With
+    prune, only hashes still in use are kept in the cache file (use for full
+    builds).
+    """
+    cache = load_cache(cache_file)
+    digests = {}
+    missing = 0
+    for src in sorted(sources):
+        image_file = site_root / src
+        if Path(src).suffix.lower() in VECTOR_EXTENSIONS:
+            continue
+        if not image_file.is_file():
+            missing += 1
+            continue
+        digests[src] = hashlib.sha256(image_file.read_bytes()).hexdigest()
+
+    todo = sorted({digest: src for src, digest in digests.items() if digest not in cache}.items())
+    failed_digests = {}
+    if todo:
+        with ProcessPoolExecutor() as pool:
+            results = pool.map(try_compute_placeholder, [str(site_root / src) for _, src in todo])
+            for (digest, _), (placeholder, error) in zip(todo, results):
+                if error:
+                    failed_digests[digest] = error
+                else:
+                    cache[digest] = placeholder
+
+    used = {digest: cache[digest] for digest in digests.values() if digest in cache} if prune else cache
+    with open(cache_file, "w", encoding="utf-8") as f:
+        json.dump({"version": CACHE_VERSION, "placeholders": used}, f, indent=1, sort_keys=True)
+
+    placeholders = {src: cache[digest] for src, digest in digests.items() if digest in cache}
+    failures = {src: failed_digests[digest] for src, digest in digests.items() if digest in failed_digests}
+    stats = {
+        "cached": len(set(digests.values())) - len(todo),
+        "computed": len(todo) - len(failed_digests),
+        "missing": missing,
+        "failed": len(failures),
+    }
+    return placeholders, stats, failures
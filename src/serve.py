@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Preview server - serves the built dist/ tree with GitHub Pages' headers.
+
+Unlike `python3 -m http.server` it sends ETag/Last-Modified validators and
+answers conditional requests with 304, gzips text on the fly, sends the same
+Cache-Control for every file as Pages does, and supports single byte-range
+requests.
+
+Usage: python3 serve.py [--port 8000] [--dir ../dist]
+"""
+
+import argparse
+import email.utils
+import gzip
+import mimetypes
+import os
+import re
+import sys
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SITE_ROOT = Path(__file__).parent.parent
+DIST_DIR = SITE_ROOT / "dist"
+
+# GitHub Pages sends this for every file, HTML included, so a deploy can
+# take up to ten minutes to reach returning visitors
+CACHE_CONTROL = "max-age=600"
+
+# Served gzip-compressed when the client accepts it (Pages does not use brotli)
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "image/svg+xml")
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def accepted_encodings(header: str) -> set:
+    """Parse Accept-Encoding into the set of codings with non-zero quality."""
+    encodings = set()
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding and not re.search(r"q=0(\.0*)?$", params.strip()):
+            encodings.add(coding.strip().lower())
+    return encodings
+
+
+def parse_range(header: str, size: int):
+    """
+    Parse a single-range Range header. Returns (start, end) inclusive,
+    None to ignore the header (multi-range or malformed, including a last
+    position before the first, per RFC 9110), or "unsatisfiable".
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            return "unsatisfiable"
+        return max(size - length, 0), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        return "unsatisfiable"
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+class PreviewHandler(SimpleHTTPRequestHandler):
+    """Static file handler with GitHub Pages' caching and compression."""
+
+    server_version = "LoevelPreview/1.0"
+    # Keep connections alive like Pages so the load test measures serving, not TCP setup
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, Nagle's
+    # algorithm plus delayed ACKs add ~40 ms to every keep-alive response
+    disable_nagle_algorithm = True
+
+    # path → (mtime_ns, gzip bytes), shared by all handler threads; one
+    # entry per file, replaced when the file changes
+    gzip_cache = {}
+
+    def do_GET(self):
+        self.serve(send_body=True)
+
+    def do_HEAD(self):
+        self.serve(send_body=False)
+
+    def serve(self, send_body: bool):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            if not self.path.split("?", 1)[0].endswith("/"):
+                # Redirect /foreninger/luif → /foreninger/luif/ like Pages
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                self.send_header("Location", self.path.split("?", 1)[0] + "/")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            path = os.path.join(path, "index.html")
+        if not os.path.isfile(path):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return
+
+        stat = os.stat(path)
+        base_etag = '"%x-%x"' % (stat.st_mtime_ns, stat.st_size)
+        last_modified = email.utils.formatdate(stat.st_mtime, usegmt=True)
+        content_type = self.guess_type(path)
+        cache_control = CACHE_CONTROL
+
+        encoding = self.select_encoding(content_type)
+        # Validators differ per representation, as on a real CDN
+        etag = base_etag[:-1] + f'-{encoding}"' if encoding else base_etag
+
+        if self.not_modified(base_etag, stat.st_mtime):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.send_header("Cache-Control", cache_control)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+
+        body = self.read_body(path, encoding, stat)
+
+        status = HTTPStatus.OK
+        content_range = None
+        range_header = self.headers.get("Range")
+        if range_header and not encoding and self.if_range_matches(etag, last_modified):
+            byte_range = parse_range(range_header, len(body))
+            if byte_range == "unsatisfiable":
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if byte_range:
+                start, end = byte_range
+                content_range = f"bytes {start}-{end}/{len(body)}"
+                body = body[start:end + 1]
+                status = HTTPStatus.PARTIAL_CONTENT
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        self.send_header("Cache-Control", cache_control)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if content_range:
+            self.send_header("Content-Range", content_range)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def not_modified(self, etag: str, mtime: float) -> bool:
+        """Evaluate If-None-Match (preferred) or If-Modified-Since."""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match:
+            tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            # Compressed variants carry a coding suffix; they validate the same file
+            return "*" in tags or any(tag == etag or tag.startswith(etag[:-1] + "-") for tag in tags)
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(mtime) <= since
+        return False
+
+    def if_range_matches(self, etag: str, last_modified: str) -> bool:
+        """Honour If-Range: only serve a partial response for an unchanged file."""
+        if_range = self.headers.get("If-Range")
+        return not if_range or if_range.strip() in (etag, last_modified)
+
+    def select_encoding(self, content_type: str):
+        """Pick the content coding to send: "gzip" for text the client accepts gzipped, else None."""
+        accepted = accepted_encodings(self.headers.get("Accept-Encoding"))
+        if "gzip" in accepted and content_type.startswith(COMPRESSIBLE_TYPES):
+            return "gzip"
+        return None
+
+    def read_body(self, path: str, encoding: str, stat) -> bytes:
+        """Read the file, compressing (and caching) it when gzip was selected."""
+        with open(path, "rb") as f:
+            body = f.read()
+        if not encoding:
+            return body
+        cached = self.gzip_cache.get(path)
+        if cached is None or cached[0] != stat.st_mtime_ns:
+            cached = (stat.st_mtime_ns, gzip.compress(body, compresslevel=6, mtime=0))
+            self.gzip_cache[path] = cached
+        return cached[1]
+
+    def guess_type(self, path):
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in ("application/json", "application/javascript"):
+            content_type += "; charset=utf-8"
+        return content_type
+
+    def log_message(self, format, *args):
+        if not getattr(self.server, "quiet", False):
+            super().log_message(format, *args)
+
+
+def create_server(directory: Path, port: int, host: str = "127.0.0.1", quiet: bool = False) -> ThreadingHTTPServer:
+    """Create (but do not start) a preview server for a built tree."""
+    handler = partial(PreviewHandler, directory=str(directory))
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.quiet = quiet
+    return server
+
+
+def main(argv: list = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Serve the built site with GitHub Pages' headers.")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--dir", type=Path, default=DIST_DIR, help="built site to serve (default: dist/)")
+    args = parser.parse_args(argv)
+
+    if not (args.dir / "index.html").is_file():
+        print(f"❌ No built site in {args.dir} - run python3 build.py first")
+        return 1
+
+    server = create_server(args.dir, args.port, args.host)
+    print(f"🌐 Serving {args.dir} at http://{args.host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,357 @@
+"""
+Site model - site-data.json parsed once into compact, validated objects
+Separation: Logic only, no HTML generation
+
+All model classes use __slots__, so renderers read plain attributes instead
+of re-parsing raw dicts on every render. Malformed content raises
+SiteDataError naming its JSON path, e.g.
+    pages["foreninger/luif"].sections[3].columns[0].src: missing required value
+"""
+
+from budget import DEFAULT_BUDGETS
+
+# Types parsed into model attributes below. Only other (plugin-registered)
+# types keep their raw dict in `data`, so the parsed model does not hold
+# on to site-data.json.
+BUILTIN_SECTION_TYPES = {"header", "text", "content", "video", "slider", "gallery", "fragment"}
+BUILTIN_COLUMN_TYPES = {"text", "image", "map", "iframe", "gallery", "video"}
+
+# Column widths with a layout in assets/styles.css: "2" switches a two-col
+# row to the 1:2 ratio, wider columns get .col-span-N
+COLUMN_WIDTHS = ("1", "2", "3")
+
+
+class SiteDataError(ValueError):
+    """Malformed site data; the message starts with the JSON path."""
+
+    def __init__(self, path: str, message: str):
+        super().__init__(f"{path}: {message}")
+        self.path = path
+
+
+class BulletGroup:
+    """A bullet list with an optional bold title."""
+    __slots__ = ("title", "items")
+
+    def __init__(self, title: str, items: list):
+        self.title = title
+        self.items = items
+
+
+class Text:
+    """
+    Text in either format: pre-rendered `content` HTML (old format), or
+    title + paragraphs + bullets (new format).
+    """
+    __slots__ = ("content", "title", "paragraphs", "bullets")
+
+    def __init__(self, content: str, title: str, paragraphs: list, bullets: list):
+        self.content = content
+        self.title = title
+        self.paragraphs = paragraphs
+        self.bullets = bullets
+
+
+class Image:
+    """A gallery or slider image."""
+    __slots__ = ("src", "alt", "placeholder", "image_size")
+
+    def __init__(self, src: str, alt: str):
+        self.src = src
+        self.alt = alt
+        self.placeholder = ""
+        self.image_size = None
+
+
+class Column:
+    """
+    One column of a content section. Which attributes are used depends on
+    `type`; `data` holds the raw dict only for column types added by
+    plugins (None for built-in types).
+    """
+    __slots__ = (
+        "type", "width", "id", "src", "alt", "placeholder", "image_size", "text",
+        "images", "page_size", "manifest", "gallery_id", "video_id", "data",
+    )
+
+    def __init__(self, col_type: str, data: dict = None):
+        self.type = col_type
+        self.width = "1"
+        self.id = ""
+        self.src = ""
+        self.alt = ""
+        self.placeholder = ""
+        self.image_size = None
+        self.text = None
+        self.images = []
+        self.page_size = None
+        self.manifest = None
+        self.gallery_id = ""
+        self.video_id = ""
+        self.data = data
+
+
+class Section:
+    """
+    One page section. Which attributes are used depends on `type`; `data`
+    holds the raw dict only for section types added by plugins (None for
+    built-in types). "fragment" sections are created by page_builder and
+    hold deferred `sections`.
+    """
+    __slots__ = (
+        "type", "id", "title", "collapsible", "layout", "columns", "text",
+        "images", "page_size", "manifest", "gallery_id", "slider_id", "video_id", "autoplay", "src",
+        "sections", "data",
+    )
+
+    def __init__(self, section_type: str, data: dict = None):
+        self.type = section_type
+        self.id = ""
+        self.title = ""
+        self.collapsible = False
+        self.layout = "single"
+        self.columns = []
+        self.text = None
+        self.images = []
+        self.page_size = None
+        self.manifest = None
+        self.gallery_id = ""
+        self.slider_id = ""
+        self.video_id = ""
+        self.autoplay = 0
+        self.src = ""
+        self.sections = []
+        self.data = data
+
+
+class Hero:
+    """Front page banner."""
+    __slots__ = ("image", "title", "subtitle", "placeholder")
+
+    def __init__(self, image: str, title: str, subtitle: str):
+        self.image = image
+        self.title = title
+        self.subtitle = subtitle
+        self.placeholder = ""
+
+
+class Page:
+    """A page from site-data.json, keyed by its page id."""
+    __slots__ = ("id", "title", "description", "hero", "sections", "lazy_sections", "budgets")
+
+    def __init__(self, page_id: str, title: str, description: str, hero, sections: list,
+                 lazy_sections: bool, budgets: dict):
+        self.id = page_id
+        self.title = title
+        self.description = description
+        self.hero = hero
+        self.sections = sections
+        self.lazy_sections = lazy_sections
+        self.budgets = budgets
+
+
+class Site:
+    """The whole site: global settings plus pages in site-data order."""
+    __slots__ = ("title", "description", "budgets", "pages")
+
+    def __init__(self, title: str, description: str, budgets: dict, pages: dict):
+        self.title = title
+        self.description = description
+        self.budgets = budgets
+        self.pages = pages
+
+
+# Parsing helpers
+
+def _value(data: dict, key: str, kind, path: str, default=None, required: bool = False):
+    """Read data[key], checking its JSON type. kind is a type or tuple of types."""
+    if key not in data or data[key] is None:
+        if required:
+            raise SiteDataError(f"{path}.{key}", "missing required value")
+        return default
+    value = data[key]
+    # bool is an int subclass; never accept it where a number is expected
+    if not isinstance(value, kind) or (isinstance(value, bool) and kind is not bool):
+        names = kind.__name__ if isinstance(kind, type) else " or ".join(k.__name__ for k in kind)
+        raise SiteDataError(f"{path}.{key}", f"expected {names}, got {type(value).__name__}")
+    if required and value in ("", []):
+        raise SiteDataError(f"{path}.{key}", "must not be empty")
+    return value
+
+
+def _object(value, path: str) -> dict:
+    if not isinstance(value, dict):
+        raise SiteDataError(path, f"expected object, got {type(value).__name__}")
+    return value
+
+
+def _strings(data: dict, key: str, path: str) -> list:
+    values = _value(data, key, list, path, default=[])
+    for i, value in enumerate(values):
+        if not isinstance(value, str):
+            raise SiteDataError(f"{path}.{key}[{i}]", f"expected str, got {type(value).__name__}")
+    return values
+
+
+def parse_budgets(data: dict, path: str) -> dict:
+    """Parse a budgets object: known budget names → {"warn"/"fail": kB}."""
+    budgets = _value(data, "budgets", dict, path, default={})
+    for name, limits in budgets.items():
+        limits_path = f"{path}.budgets.{name}"
+        if name not in DEFAULT_BUDGETS:
+            raise SiteDataError(limits_path, f"unknown budget (known: {', '.join(sorted(DEFAULT_BUDGETS))})")
+        _object(limits, limits_path)
+        for level in limits:
+            if level not in ("warn", "fail"):
+                raise SiteDataError(f"{limits_path}.{level}", 'unknown limit (known: "warn", "fail")')
+            _value(limits, level, (int, float), limits_path)
+    return budgets
+
+
+def parse_text(data: dict, path: str) -> Text:
+    """Parse either text format; at least one part must be present."""
+    bullets = []
+    for i, group in enumerate(_value(data, "bullets", list, path, default=[])):
+        group_path = f"{path}.bullets[{i}]"
+        group = _object(group, group_path)
+        bullets.append(BulletGroup(
+            _value(group, "title", str, group_path, default=""),
+            _strings(group, "items", group_path),
+        ))
+    text = Text(
+        _value(data, "content", str, path, default=""),
+        _value(data, "title", str, path, default=""),
+        _strings(data, "paragraphs", path),
+        bullets,
+    )
+    if not (text.content or text.title or text.paragraphs or text.bullets):
+        raise SiteDataError(path, 'text needs "content" or "title"/"paragraphs"/"bullets"')
+    return text
+
+
+def parse_images(data: dict, path: str) -> list:
+    images = []
+    for i, image in enumerate(_value(data, "images", list, path, required=True)):
+        image_path = f"{path}.images[{i}]"
+        image = _object(image, image_path)
+        images.append(Image(
+            _value(image, "src", str, image_path, required=True),
+            _value(image, "alt", str, image_path, default=""),
+        ))
+    return images
+
+
+def _page_size(data: dict, path: str):
+    page_size = _value(data, "page_size", int, path)
+    if page_size is not None and page_size < 1:
+        raise SiteDataError(f"{path}.page_size", "must be at least 1")
+    return page_size
+
+
+def parse_column(data: dict, path: str, column_types=None) -> Column:
+    data = _object(data, path)
+    col_type = _value(data, "type", str, path, required=True)
+    if column_types is not None and col_type not in column_types:
+        raise SiteDataError(f"{path}.type", f"unknown column type '{col_type}' (known: {', '.join(sorted(column_types))})")
+
+    col = Column(col_type, None if col_type in BUILTIN_COLUMN_TYPES else data)
+    col.width = str(_value(data, "width", (str, int), path, default="1"))
+    if col.width not in COLUMN_WIDTHS:
+        raise SiteDataError(f"{path}.width", f"unsupported width '{col.width}' (known: {', '.join(COLUMN_WIDTHS)})")
+    col.id = _value(data, "id", str, path, default="")
+    if col_type == "text":
+        col.text = parse_text(data, path)
+    elif col_type in ("image", "map", "iframe"):
+        col.src = _value(data, "src", str, path, required=True)
+        col.alt = _value(data, "alt", str, path, default="")
+    elif col_type == "gallery":
+        col.images = parse_images(data, path)
+        col.page_size = _page_size(data, path)
+    elif col_type == "video":
+        col.video_id = _value(data, "video_id", str, path, required=True)
+    return col
+
+
+def parse_section(data: dict, path: str, section_types=None, column_types=None, layouts=None) -> Section:
+    data = _object(data, path)
+    section_type = _value(data, "type", str, path, required=True)
+    if section_types is not None and section_type not in section_types:
+        raise SiteDataError(f"{path}.type", f"unknown section type '{section_type}' (known: {', '.join(sorted(section_types))})")
+
+    section = Section(section_type, None if section_type in BUILTIN_SECTION_TYPES else data)
+    section.id = _value(data, "id", str, path, default="")
+    section.collapsible = _value(data, "collapsible", bool, path, default=False)
+    if section_type == "header":
+        section.title = _value(data, "title", str, path, required=True)
+    elif section_type == "text":
+        section.text = parse_text(data, path)
+    elif section_type == "content":
+        section.layout = _value(data, "layout", str, path, default="single")
+        if layouts is not None and section.layout not in layouts:
+            raise SiteDataError(f"{path}.layout", f"unknown layout '{section.layout}' (known: {', '.join(sorted(layouts))})")
+        section.columns = [
+            parse_column(col, f"{path}.columns[{i}]", column_types)
+            for i, col in enumerate(_value(data, "columns", list, path, required=True))
+        ]
+    elif section_type == "gallery":
+        section.images = parse_images(data, path)
+        section.page_size = _page_size(data, path)
+    elif section_type == "slider":
+        section.images = parse_images(data, path)
+        section.autoplay = _value(data, "autoplay", int, path, default=0)
+        if section.autoplay < 0:
+            raise SiteDataError(f"{path}.autoplay", "must not be negative")
+    elif section_type == "video":
+        section.video_id = _value(data, "video_id", str, path, required=True)
+    return section
+
+
+def parse_page(page_id: str, data: dict, site_description: str, **types) -> Page:
+    path = f'pages["{page_id}"]'
+    data = _object(data, path)
+
+    hero = None
+    if "hero" in data:
+        hero_data = _object(data["hero"], f"{path}.hero")
+        hero = Hero(
+            _value(hero_data, "image", str, f"{path}.hero", required=True),
+            _value(hero_data, "title", str, f"{path}.hero", default=""),
+            _value(hero_data, "subtitle", str, f"{path}.hero", default=""),
+        )
+
+    return Page(
+        page_id,
+        _value(data, "title", str, path, default=""),
+        _value(data, "description", str, path, default=site_description),
+        hero,
+        [
+            parse_section(section, f"{path}.sections[{i}]", **types)
+            for i, section in enumerate(_value(data, "sections", list, path, default=[]))
+        ],
+        _value(data, "lazy_sections", bool, path, default=False),
+        parse_budgets(data, path),
+    )
+
+
+def parse_site(data: dict, section_types=None, column_types=None, layouts=None) -> Site:
+    """
+    Parse and validate the whole of site-data.json.
+    section_types / column_types / layouts: the registered renderer keys;
+    when given, unknown types are rejected here instead of at render time.
+    """
+    data = _object(data, "$")
+    site = _object(_value(data, "site", dict, "$", required=True), "site")
+    description = _value(site, "description", str, "site", default="")
+    pages = {
+        page_id: parse_page(
+            page_id, page_data, description,
+            section_types=section_types, column_types=column_types, layouts=layouts,
+        )
+        for page_id, page_data in _value(data, "pages", dict, "$", required=True).items()
+    }
+    return Site(
+        _value(site, "title", str, "site", default=""),
+        description,
+        parse_budgets(site, "site"),
+        pages,
+    )
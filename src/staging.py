@@ -0,0 +1,122 @@
+"""
+Output staging - copies referenced media and assets into the output tree
+Separation: File I/O only, no HTML generation
+
+Files are hardlinked where possible, reflinked (copy-on-write clone) when
+hardlinks are not possible but the filesystem supports clones, and copied
+otherwise, so staging a complete tree costs almost no I/O or disk space.
+"""
+
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+
+from budget import find_references, resolve_reference
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# Only files below these source directories are staged into the output
+STAGED_PREFIXES = ("media/", "assets/")
+# Source files always shipped with the site
+STATIC_FILES = ("CNAME",)
+
+# Links to local files (documents etc.) in addition to loaded resources
+HREF_PATTERN = re.compile(r"""<a\b[^>]*?\bhref=['"]([^'"#]+)['"]""", re.IGNORECASE)
+
+FICLONE = 0x40049409  # linux/fs.h
+
+
+def referenced_paths(file: Path, root: Path) -> set:
+    """Return site-relative paths referenced by an HTML, CSS or manifest file below root."""
+    site_url = "/" + file.relative_to(root).as_posix()
+    text = file.read_text(encoding="utf-8")
+
+    if file.suffix == ".json":
+        # Gallery manifests list site-relative image paths
+        data = json.loads(text)
+        return {img["src"] for img in data.get("images", []) if img.get("src")}
+
+    refs = [ref for _, ref in find_references(text)]
+    refs += HREF_PATTERN.findall(text)
+    paths = (resolve_reference(site_url, ref) for ref in refs)
+    return {path for path in paths if path}
+
+
+def link_or_copy(source: Path, target: Path) -> str:
+    """
+    Stage one file as a hardlink, reflink or copy (in that order of
+    preference). Returns the method used, or "unchanged" if the target
+    already is the same file or an up-to-date copy of it.
+    """
+    if target.exists():
+        if target.samefile(source):
+            return "unchanged"
+        source_stat, target_stat = source.stat(), target.stat()
+        if (source_stat.st_size, source_stat.st_mtime_ns) == (target_stat.st_size, target_stat.st_mtime_ns):
+            return "unchanged"
+        target.unlink()
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        os.link(source, target)
+        return "hardlink"
+    except OSError:
+        pass
+
+    if fcntl is not None:
+        try:
+            with open(source, "rb") as src, open(target, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            shutil.copystat(source, target)
+            return "reflink"
+        except OSError:
+            target.unlink(missing_ok=True)
+
+    shutil.copy2(source, target)
+    return "copy"
+
+
+def stage_files(generated: set, source_dir: Path, output_dir: Path) -> tuple:
+    """
+    Stage every media/asset file referenced by the generated files.
+    Staged CSS files are scanned for their own references. Returns
+    (staged, stats): the set of staged output paths and a count per method.
+    """
+    pending = [(path, output_dir) for path in generated if path.suffix in (".html", ".json")]
+    wanted = {rel_path for rel_path in STATIC_FILES if (source_dir / rel_path).is_file()}
+    while pending:
+        file, root = pending.pop()
+        for rel_path in referenced_paths(file, root):
+            if rel_path in wanted or not rel_path.startswith(STAGED_PREFIXES):
+                continue
+            if (output_dir / rel_path) in generated or not (source_dir / rel_path).is_file():
+                continue
+            wanted.add(rel_path)
+            if rel_path.endswith(".css"):
+                pending.append((source_dir / rel_path, source_dir))
+
+    stats = {}
+    staged = set()
+    for rel_path in sorted(wanted):
+        method = link_or_copy(source_dir / rel_path, output_dir / rel_path)
+        stats[method] = stats.get(method, 0) + 1
+        staged.add(output_dir / rel_path)
+    return staged, stats
+
+
+def prune_output(output_dir: Path, keep: set) -> int:
+    """Delete files in the output tree that this build did not produce."""
+    removed = 0
+    for path in sorted(output_dir.rglob("*"), reverse=True):
+        if path.is_file() and path not in keep:
+            path.unlink()
+            removed += 1
+        elif path.is_dir() and not any(path.iterdir()):
+            path.rmdir()
+    return removed
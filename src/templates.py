@@ -3,7 +3,6 @@ HTML Component Templates for Løvel website
 Separates HTML rendering from data and build logic
 """
 
-import json
 
 def render_header(title: str, is_collapsible: bool = False, section_id: str = "") -> str:
     """Render a page section header."""
@@ -12,191 +11,287 @@ def render_header(title: str, is_collapsible: bool = False, section_id: str = ""
     return f"<div class='section'><div class='container'><h1>{title}</h1></div></div>\n"
 
 
-def render_text_section(content: str = None, title: str = None, paragraphs: list = None, bullets: list = None, is_collapsible: bool = False, section_id: str = "") -> str:
+def render_text_body(text, title_tag: str) -> str:
     """
-    Render a text-only section.
-    Supports both old format (content as HTML string) and new format (title + paragraphs + bullets).
-    
-    Bullets format: [{"title": "Group Title", "items": ["item1", "item2"]}, ...]
+    Render a Text model in either format: pre-rendered `content` HTML (old
+    format) or title + paragraphs + bullet groups (new format).
     """
-    collapse_class = "collapsible-content collapsed" if is_collapsible else ""
-    collapse_attr = f"data-section='{section_id}'" if is_collapsible and section_id else ""
-    
-    # Build HTML content
-    html_content = ""
-    
-    if content:
-        # Old format - pre-rendered HTML
-        html_content = content
-    else:
-        # New format - build from title and paragraphs
-        if title:
-            html_content += f"<h3>{title}</h3>"
-        
-        if paragraphs:
-            for para in paragraphs:
-                html_content += f"<p>{para}</p>"
-        
-        if bullets:
-            for bullet_group in bullets:
-                group_title = bullet_group.get("title")
-                items = bullet_group.get("items", [])
-                
-                if group_title:
-                    html_content += f"<p><strong>{group_title}</strong></p>"
-                
-                if items:
-                    html_content += "<ul>"
-                    for item in items:
-                        html_content += f"<li>{item}</li>"
-                    html_content += "</ul>"
-    
-    return f"<div class='section {collapse_class}' {collapse_attr}><div class='container'>{html_content}</div></div>\n"
-
-
-def render_text_column(content: str = None, title: str = None, paragraphs: list = None, bullets: list = None) -> str:
-    """
-    Render a text column in two-column layout.
-    Can accept either:
-    - content: pre-rendered HTML string (old format)
-    - title + paragraphs: new format with title and paragraph list
-    - bullets: list of bullet point groups with titles and items
-    
-    Bullets format: [{"title": "Group Title", "items": ["item1", "item2"]}, ...]
-    """
-    if content:
+    if text.content:
         # Old format - already HTML
-        return content
+        return text.content
     
     # New format - build from title and paragraphs
     html = ""
-    if title:
-        html += f"<h2>{title}</h2>"
+    if text.title:
+        html += f"<{title_tag}>{text.title}</{title_tag}>"
     
-    if paragraphs:
-        for para in paragraphs:
-            html += f"<p>{para}</p>"
+    for para in text.paragraphs:
+        html += f"<p>{para}</p>"
     
-    if bullets:
-        for bullet_group in bullets:
-            group_title = bullet_group.get("title")
-            items = bullet_group.get("items", [])
-            
-            if group_title:
-                html += f"<p><strong>{group_title}</strong></p>"
-            
-            if items:
-                html += "<ul>"
-                for item in items:
-                    html += f"<li>{item}</li>"
-                html += "</ul>"
+    for bullet_group in text.bullets:
+        if bullet_group.title:
+            html += f"<p><strong>{bullet_group.title}</strong></p>"
+        
+        if bullet_group.items:
+            html += "<ul>"
+            for item in bullet_group.items:
+                html += f"<li>{item}</li>"
+            html += "</ul>"
     
     return html
 
 
-def render_image_column(src: str, root_path: str, alt: str = "") -> str:
+def render_text_section(text, is_collapsible: bool = False, section_id: str = "") -> str:
+    """Render a text-only section from a Text model (titles as <h3>)."""
+    collapse_class = "collapsible-content collapsed" if is_collapsible else ""
+    collapse_attr = f"data-section='{section_id}'" if is_collapsible and section_id else ""
+    
+    return f"<div class='section {collapse_class}' {collapse_attr}><div class='container'>{render_text_body(text, 'h3')}</div></div>\n"
+
+
+def render_text_column(text) -> str:
+    """Render a text column from a Text model (titles as <h2>)."""
+    return render_text_body(text, "h2")
+
+
+def render_placeholder(placeholder: str) -> str:
+    """Render a blurred LQIP image that sits underneath the real image until it loads."""
+    return f"<img class='lqip' src='{placeholder}' alt='' aria-hidden='true'>"
+
+
+def render_size_attrs(image_size) -> str:
+    """Render width/height attributes so the browser reserves the image's box."""
+    if not image_size:
+        return ""
+    return f" width='{image_size[0]}' height='{image_size[1]}'"
+
+
+def render_image_column(src: str, root_path: str, alt: str = "", placeholder: str = "", image_size=None) -> str:
     """Render an image column in two-column layout."""
-    return f"<div class='img-container'><img src='{root_path}{src}' alt='{alt}'></div>"
+    img = f"<img src='{root_path}{src}' alt='{alt}'{render_size_attrs(image_size)}>"
+    if placeholder:
+        return f"<div class='img-container has-lqip'>{render_placeholder(placeholder)}{img}</div>"
+    return f"<div class='img-container'>{img}</div>"
 
 
 def render_map_column(src: str, alt: str = "") -> str:
     """Render an OpenStreetMap iframe column."""
-    return f"<iframe src='{src}' style='border: 1px solid #ccc; width: 100%; height: 400px;' frameborder='0'></iframe>"
+    return f"<iframe class='embed-frame embed-map' src='{src}' frameborder='0'></iframe>"
 
 
 def render_iframe_column(src: str, alt: str = "") -> str:
     """Render a generic iframe column."""
-    return f"<iframe src='{src}' style='border: 1px solid #ccc; width: 100%; height: 600px;' frameborder='0' allow='fullscreen'></iframe>"
+    return f"<iframe class='embed-frame embed-iframe' src='{src}' frameborder='0' allow='fullscreen'></iframe>"
 
 
-def render_gallery(images: list, root_path: str) -> str:
-    """Render a gallery of images in grid format with lightbox."""
-    gallery_id = "gallery-lightbox"
-    html = f"<div class='gallery-grid' id='{gallery_id}'>"
-    
-    # Create grid items
+def render_gallery(images: list, root_path: str, manifest: dict = None, gallery_id: str = "gallery") -> str:
+    """
+    Render a gallery of Image models in grid format with lightbox.
+    
+    manifest: set by page_builder.paginate_gallery() for large galleries.
+    Then `images` is only the first page; later pages are fetched from the
+    JSON manifest as the grid scrolls into view or the lightbox reaches them.
+    gallery_id: unique per page (page_builder.paginate_galleries); element
+    ids derive from it and the script is scoped to it, so several galleries
+    can share a page.
+    """
+    lightbox_id = f"{gallery_id}-lightbox"
+    manifest_attrs = ""
+    if manifest:
+        manifest_attrs = (
+            f" data-manifest='{root_path}{manifest['url']}'"
+            f" data-pages='{manifest['pages']}' data-total='{manifest['total']}'"
+        )
+    html = f"<div class='gallery-grid' id='{gallery_id}' data-root='{root_path}' data-lightbox='{lightbox_id}'{manifest_attrs}>"
+    
+    # Create grid items (the lightbox reads its image list from these)
     for idx, img in enumerate(images):
-        src = img.get("src", "")
-        alt = img.get("alt", "")
-        html += f"<div class='gallery-item' data-index='{idx}' onclick='openLightbox({idx})'><img src='{root_path}{src}' alt='{alt}'></div>"
+        img_tag = f"<img src='{root_path}{img.src}' alt='{img.alt}'{render_size_attrs(img.image_size)}>"
+        if img.placeholder:
+            html += f"<div class='gallery-item has-lqip' data-index='{idx}'>{render_placeholder(img.placeholder)}{img_tag}</div>"
+        else:
+            html += f"<div class='gallery-item' data-index='{idx}'>{img_tag}</div>"
     
     html += "</div>"
+    if manifest:
+        html += "<div class='gallery-sentinel' aria-hidden='true'></div>"
     
     # Add lightbox modal
     html += f"""
-<div id='lightbox-modal' class='lightbox-modal' onclick='closeLightbox(event)'>
-    <span class='lightbox-close' onclick='closeLightbox()'>&times;</span>
-    <button class='lightbox-prev' onclick='prevLightbox(event)'>&#10094;</button>
+<div id='{lightbox_id}' class='lightbox-modal'>
+    <span class='lightbox-close'>&times;</span>
+    <button class='lightbox-prev'>&#10094;</button>
     <div class='lightbox-container'>
-        <img id='lightbox-image' src='' alt=''>
+        <img class='lightbox-image' src='' alt=''>
     </div>
-    <button class='lightbox-next' onclick='nextLightbox(event)'>&#10095;</button>
+    <button class='lightbox-next'>&#10095;</button>
 </div>
 
 <script>
-let lightboxIndex = 0;
-const lightboxImages = {json.dumps([img.get('src', '') for img in images])};
-
-function openLightbox(index) {{
-    lightboxIndex = index;
-    updateLightbox();
-    document.getElementById('lightbox-modal').style.display = 'flex';
-    document.body.style.overflow = 'hidden';
-}}
-
-function closeLightbox(event) {{
-    if (event && event.target.id !== 'lightbox-modal') return;
-    document.getElementById('lightbox-modal').style.display = 'none';
-    document.body.style.overflow = 'auto';
-}}
-
-function updateLightbox() {{
-    const img = document.getElementById('lightbox-image');
-    const src = '{root_path}' + lightboxImages[lightboxIndex];
-    img.src = src;
-}}
-
-function nextLightbox(event) {{
-    event.stopPropagation();
-    lightboxIndex = (lightboxIndex + 1) % lightboxImages.length;
-    updateLightbox();
-}}
-
-function prevLightbox(event) {{
-    event.stopPropagation();
-    lightboxIndex = (lightboxIndex - 1 + lightboxImages.length) % lightboxImages.length;
-    updateLightbox();
-}}
-
-// Keyboard navigation
-document.addEventListener('keydown', function(event) {{
-    const modal = document.getElementById('lightbox-modal');
-    if (modal.style.display !== 'flex') return;
-    
-    if (event.key === 'ArrowRight') {{
-        nextLightbox({{stopPropagation: function() {{}}}});
-    }} else if (event.key === 'ArrowLeft') {{
-        prevLightbox({{stopPropagation: function() {{}}}});
-    }} else if (event.key === 'Escape') {{
-        closeLightbox();
+(function() {{
+    const galleryGrid = document.getElementById('{gallery_id}');
+    if (!galleryGrid) return;
+    
+    const modal = document.getElementById(galleryGrid.dataset.lightbox);
+    const lightboxImage = modal.querySelector('.lightbox-image');
+    const galleryPages = parseInt(galleryGrid.dataset.pages || '1');
+    let lightboxIndex = 0;
+    let galleryLoadedPages = 1;
+    let galleryLoading = null;
+    
+    function galleryItems() {{
+        return galleryGrid.querySelectorAll('.gallery-item img:not(.lqip)');
+    }}
+    
+    function galleryTotal() {{
+        return parseInt(galleryGrid.dataset.total || galleryItems().length);
+    }}
+    
+    // Fetch the next manifest page and append its items to the grid
+    function loadGalleryPage() {{
+        if (galleryLoadedPages >= galleryPages) return Promise.resolve();
+        if (galleryLoading) return galleryLoading;
+        
+        const url = galleryGrid.dataset.manifest.replace('{{page}}', galleryLoadedPages + 1);
+        galleryLoading = fetch(url)
+            .then(response => response.json())
+            .then(data => {{
+                let index = galleryItems().length;
+                data.images.forEach(image => {{
+                    const item = document.createElement('div');
+                    item.className = 'gallery-item';
+                    item.dataset.index = index++;
+                    if (image.placeholder) {{
+                        const lqip = document.createElement('img');
+                        lqip.className = 'lqip';
+                        lqip.src = image.placeholder;
+                        lqip.alt = '';
+                        lqip.setAttribute('aria-hidden', 'true');
+                        item.classList.add('has-lqip');
+                        item.appendChild(lqip);
+                    }}
+                    const img = document.createElement('img');
+                    img.src = galleryGrid.dataset.root + image.src;
+                    img.alt = image.alt;
+                    if (image.width) {{
+                        img.width = image.width;
+                        img.height = image.height;
+                    }}
+                    item.appendChild(img);
+                    galleryGrid.appendChild(item);
+                }});
+                galleryLoadedPages = data.page;
+            }})
+            .finally(() => {{ galleryLoading = null; }});
+        return galleryLoading;
+    }}
+    
+    galleryGrid.addEventListener('click', function(event) {{
+        const item = event.target.closest('.gallery-item');
+        if (item) openLightbox(parseInt(item.dataset.index));
+    }});
+    
+    // Infinite scroll: load the next page when the end of the grid comes into view
+    const gallerySentinel = galleryGrid.nextElementSibling;
+    if (galleryPages > 1 && gallerySentinel && 'IntersectionObserver' in window) {{
+        const observer = new IntersectionObserver(entries => {{
+            if (!entries[0].isIntersecting) return;
+            loadGalleryPage().then(() => {{
+                if (galleryLoadedPages >= galleryPages) {{
+                    observer.disconnect();
+                    return;
+                }}
+                // The new items may not push the sentinel out of range;
+                // re-observing reports its current state so loading continues
+                observer.unobserve(gallerySentinel);
+                observer.observe(gallerySentinel);
+            }}, () => {{
+                // Retried when the sentinel next scrolls into view
+            }});
+        }}, {{ rootMargin: '400px' }});
+        observer.observe(gallerySentinel);
+    }}
+    
+    function openLightbox(index) {{
+        lightboxIndex = index;
+        updateLightbox();
+        modal.style.display = 'flex';
+        document.body.style.overflow = 'hidden';
+    }}
+    
+    function closeLightbox() {{
+        modal.style.display = 'none';
+        document.body.style.overflow = 'auto';
+    }}
+    
+    function updateLightbox() {{
+        const items = galleryItems();
+        if (lightboxIndex >= items.length) {{
+            // Image is on a page that has not been loaded yet
+            loadGalleryPage().then(updateLightbox, () => {{
+                // The page could not be fetched; stay on the last loaded image
+                lightboxIndex = galleryItems().length - 1;
+                updateLightbox();
+            }});
+            return;
+        }}
+        lightboxImage.src = items[lightboxIndex].src;
+        lightboxImage.alt = items[lightboxIndex].alt;
     }}
-}});
+    
+    function nextLightbox() {{
+        lightboxIndex = (lightboxIndex + 1) % galleryTotal();
+        updateLightbox();
+    }}
+    
+    function prevLightbox() {{
+        lightboxIndex = (lightboxIndex - 1 + galleryTotal()) % galleryTotal();
+        updateLightbox();
+    }}
+    
+    // Clicks on the dark backdrop close the lightbox, clicks on the image do not
+    modal.addEventListener('click', function(event) {{
+        if (event.target === modal) closeLightbox();
+    }});
+    modal.querySelector('.lightbox-close').addEventListener('click', closeLightbox);
+    modal.querySelector('.lightbox-prev').addEventListener('click', prevLightbox);
+    modal.querySelector('.lightbox-next').addEventListener('click', nextLightbox);
+    
+    // Keyboard navigation
+    document.addEventListener('keydown', function(event) {{
+        if (modal.style.display !== 'flex') return;
+        
+        if (event.key === 'ArrowRight') {{
+            nextLightbox();
+        }} else if (event.key === 'ArrowLeft') {{
+            prevLightbox();
+        }} else if (event.key === 'Escape') {{
+            closeLightbox();
+        }}
+    }});
+}})();
 </script>
 """
     return html
 
 
-def render_slider(images: list, root_path: str) -> str:
-    """Render an image slider/carousel."""
-    slider_id = "media-slider"
-    html = f"<div class='slider' id='{slider_id}'>"
+def render_slider(images: list, root_path: str, autoplay: int = 0, slider_id: str = "slider") -> str:
+    """
+    Render an image slider/carousel of Image models.
+    
+    Only the first slide gets a real src; the others carry data-src and are
+    loaded through a shared decode-ahead queue when they become active or
+    adjacent to the active slide.
+    autoplay: interval in milliseconds (0 = off); paused while the tab is hidden.
+    slider_id: unique per page (page_builder.number_sliders).
+    """
+    html = f"<div class='slider' id='{slider_id}' data-autoplay='{autoplay}'>"
     
     # Create slides
     for idx, img in enumerate(images):
-        src = img.get("src", "")
-        alt = img.get("alt", "")
         active_class = "active" if idx == 0 else ""
-        html += f"<div class='slide {active_class}'><img src='{root_path}{src}' alt='{alt}'></div>"
+        src_attr = "src" if idx == 0 else "data-src"
+        html += f"<div class='slide {active_class}'><img {src_attr}='{root_path}{img.src}' alt='{img.alt}'></div>"
     
     # Navigation buttons
     html += "<button class='slider-prev' aria-label='Previous slide'>&#10094;</button>"
@@ -213,6 +308,31 @@ def render_slider(images: list, root_path: str) -> str:
     
     # Add slider JavaScript
     html += f"""<script>
+// Shared by all sliders on the page: decodes deferred slides one at a time
+window.slideDecodeQueue = window.slideDecodeQueue || (function() {{
+    const pending = [];
+    let busy = false;
+    
+    function pump() {{
+        if (busy || !pending.length) return;
+        const img = pending.shift();
+        if (!img.dataset.src) {{ pump(); return; }}
+        busy = true;
+        img.src = img.dataset.src;
+        img.removeAttribute('data-src');
+        const done = () => {{ busy = false; pump(); }};
+        (img.decode ? img.decode() : Promise.resolve()).then(done, done);
+    }}
+    
+    return {{
+        push(img, urgent) {{
+            if (!img || !img.dataset.src) return;
+            if (urgent) pending.unshift(img); else pending.push(img);
+            pump();
+        }}
+    }};
+}})();
+
 (function() {{
     const slider = document.getElementById('{slider_id}');
     if (!slider) return;
@@ -221,7 +341,16 @@ def render_slider(images: list, root_path: str) -> str:
     const dots = slider.querySelectorAll('.slider-dot');
     const prevBtn = slider.querySelector('.slider-prev');
     const nextBtn = slider.querySelector('.slider-next');
+    const autoplay = parseInt(slider.dataset.autoplay || '0');
     let currentIndex = 0;
+    let timer = null;
+    
+    function loadAround(index) {{
+        // Active slide first, then its neighbours
+        window.slideDecodeQueue.push(slides[index].querySelector('img'), true);
+        window.slideDecodeQueue.push(slides[(index + 1) % slides.length].querySelector('img'));
+        window.slideDecodeQueue.push(slides[(index - 1 + slides.length) % slides.length].querySelector('img'));
+    }}
     
     function showSlide(index) {{
         slides.forEach(slide => slide.classList.remove('active'));
@@ -230,6 +359,7 @@ def render_slider(images: list, root_path: str) -> str:
         slides[index].classList.add('active');
         dots[index].classList.add('active');
         currentIndex = index;
+        loadAround(index);
     }}
     
     function nextSlide() {{
@@ -242,6 +372,15 @@ def render_slider(images: list, root_path: str) -> str:
         showSlide(prevIndex);
     }}
     
+    function startAutoplay() {{
+        if (autoplay > 0 && !timer) timer = setInterval(nextSlide, autoplay);
+    }}
+    
+    function stopAutoplay() {{
+        clearInterval(timer);
+        timer = null;
+    }}
+    
     if (prevBtn) prevBtn.addEventListener('click', prevSlide);
     if (nextBtn) nextBtn.addEventListener('click', nextSlide);
     
@@ -258,6 +397,15 @@ def render_slider(images: list, root_path: str) -> str:
             }}
         }});
     }});
+    
+    // Pause autoplay while the tab is hidden
+    document.addEventListener('visibilitychange', () => {{
+        if (document.hidden) stopAutoplay(); else startAutoplay();
+    }});
+    
+    // Preload the neighbours of the first slide once the page has loaded
+    window.addEventListener('load', () => loadAround(currentIndex));
+    if (!document.hidden) startAutoplay();
 }})();
 </script>"""
     
@@ -266,11 +414,53 @@ def render_slider(images: list, root_path: str) -> str:
 
 def render_video_column(video_id: str) -> str:
     """Render a YouTube video embed in a column."""
-    return f"""<div class='video-container' style='position: relative; width: 100%; padding-bottom: 56.25%; height: 0; overflow: hidden; border-radius: 8px;'>
-    <iframe style='position: absolute; top: 0; left: 0; width: 100%; height: 100%; border: none; border-radius: 8px;' src='https://www.youtube.com/embed/{video_id}?rel=0&showinfo=0' allowfullscreen='' allow='accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture'></iframe>
+    return f"""<div class='video-container'>
+    <iframe src='https://www.youtube.com/embed/{video_id}?rel=0&showinfo=0' allowfullscreen='' allow='accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture'></iframe>
 </div>"""
 
 
+# Column type → renderer(col, root_path). Shared by single- and two-column
+# layouts; add new column types with register_column_type().
+COLUMN_RENDERERS = {
+    "text": lambda col, root_path: render_text_column(col.text),
+    "image": lambda col, root_path: render_image_column(col.src, root_path, col.alt, col.placeholder, col.image_size),
+    "map": lambda col, root_path: render_map_column(col.src, col.alt),
+    "iframe": lambda col, root_path: render_iframe_column(col.src, col.alt),
+    "gallery": lambda col, root_path: render_gallery(col.images, root_path, col.manifest, col.gallery_id or "gallery"),
+    "video": lambda col, root_path: render_video_column(col.video_id),
+}
+
+
+def register_column_type(col_type: str, renderer) -> None:
+    """Register a renderer(col: site_model.Column, root_path) -> str for a column type."""
+    COLUMN_RENDERERS[col_type] = renderer
+
+
+def render_column(col, root_path: str) -> str:
+    """Render a single Column model via the column registry."""
+    renderer = COLUMN_RENDERERS.get(col.type)
+    if renderer is None:
+        raise ValueError(f"Unknown column type '{col.type}' (known: {', '.join(sorted(COLUMN_RENDERERS))})")
+    return renderer(col, root_path)
+
+
+def render_single_column_section(
+    columns: list,
+    root_path: str,
+    is_collapsible: bool = False,
+    section_id: str = ""
+) -> str:
+    """Render Column models stacked in a single-column layout."""
+    collapse_class = " collapsible-content collapsed" if is_collapsible else ""
+    collapse_attr = f" data-section='{section_id}'" if is_collapsible and section_id else ""
+    
+    html = f"<div class='section{collapse_class}'{collapse_attr}><div class='container'>"
+    for col in columns:
+        html += render_column(col, root_path)
+    html += "</div></div>\n"
+    return html
+
+
 def render_two_column_section(
     columns: list, 
     root_path: str, 
@@ -278,17 +468,14 @@ def render_two_column_section(
     section_id: str = ""
 ) -> str:
     """
-    Render a two-column layout section.
-    
-    Columns should have:
-    - type: "text", "image", "gallery", or "map"
-    - For text columns: either content (HTML string) or title + paragraphs
-    - For image/map: src, alt
-    - For gallery: images list
-    - width: (optional) "1" or "2" for column width ratio
+    Render a two-column layout section from Column models.
+    
+    Each column's type must be a key of COLUMN_RENDERERS; width "2" on any
+    column switches to the 1:2 ratio layout, other widths map to the
+    .col-span-N classes (site_model.COLUMN_WIDTHS lists the supported ones).
     """
     # Check if any column has width="2" to use ratio layout
-    has_ratio = any(col.get("width") == "2" for col in columns)
+    has_ratio = any(col.width == "2" for col in columns)
     row_class = "cols-2-ratio" if has_ratio else "cols-2"
     
     collapse_class = "collapsible-content collapsed" if is_collapsible else ""
@@ -297,46 +484,25 @@ def render_two_column_section(
     html = f"<div class='section {collapse_class}' {collapse_attr}><div class='container'><div class='row {row_class}'>"
     
     for col in columns:
-        col_type = col.get("type")
-        width = col.get("width", "1")
-        col_style = f" style='grid-column: span {width};'" if width != "1" and not has_ratio else ""
-        
-        html += f"<div class='col'{col_style}>"
-        
-        if col_type == "text":
-            # Support both old (content) and new (title + paragraphs + bullets) formats
-            content = col.get("content")
-            title = col.get("title")
-            paragraphs = col.get("paragraphs")
-            bullets = col.get("bullets")
-            html += render_text_column(content, title, paragraphs, bullets)
-        elif col_type == "image":
-            html += render_image_column(col.get("src", ""), root_path, col.get("alt", ""))
-        elif col_type == "map":
-            html += render_map_column(col.get("src", ""), col.get("alt", ""))
-        elif col_type == "iframe":
-            html += render_iframe_column(col.get("src", ""), col.get("alt", ""))
-        elif col_type == "gallery":
-            html += render_gallery(col.get("images", []), root_path)
-        elif col_type == "video":
-            html += render_video_column(col.get("video_id", ""))
+        span_class = f" col-span-{col.width}" if col.width != "1" and not has_ratio else ""
         
+        html += f"<div class='col{span_class}'>"
+        html += render_column(col, root_path)
         html += "</div>"
     
     html += "</div></div></div>\n"
     return html
 
 
-def render_hero_section(hero_data: dict, root_path: str) -> str:
-    """Render the hero/banner section at top of page."""
-    image = hero_data.get("image", "")
-    title = hero_data.get("title", "")
-    subtitle = hero_data.get("subtitle", "")
+def render_hero_section(hero, root_path: str) -> str:
+    """Render the hero/banner section at top of page from a Hero model."""
+    # The placeholder is a second background layer shown until the image loads
+    placeholder = f", url('{hero.placeholder}')" if hero.placeholder else ""
     
-    html = f"""<section class="hero" style="background-image: url('{root_path}{image}'); background-size: cover; background-position: center;">
+    html = f"""<section class="hero" style="background-image: url('{root_path}{hero.image}'){placeholder};">
     <div class="hero-content">
-        <h1>{title}</h1>
-        <p>{subtitle}</p>
+        <h1>{hero.title}</h1>
+        <p>{hero.subtitle}</p>
     </div>
 </section>
 """
@@ -345,7 +511,7 @@ def render_hero_section(hero_data: dict, root_path: str) -> str:
 
 def render_business_card(title: str, content: str) -> str:
     """Render a business card component."""
-    return f"""<div class='business-card' style='padding: var(--spacing); border: 1px solid var(--border); border-radius: var(--radius); margin-bottom: var(--spacing);'>
+    return f"""<div class='business-card'>
     <h4>{title}</h4>
     {content}
 </div>"""
@@ -362,24 +528,24 @@ def render_business_grid(cards: list) -> str:
 
 def render_contact_form(form_action: str) -> str:
     """Render the contact form."""
-    return f"""<form action="{form_action}" method="POST" style="max-width: 600px; margin: 2rem 0;">
-    <div style="margin-bottom: 1rem;">
-        <label for="name" style="display: block; margin-bottom: 0.5rem; font-weight: bold;">Navn:</label>
-        <input type="text" id="name" name="name" required style="width: 100%; padding: 0.5rem; border: 1px solid #ddd; border-radius: 4px; font-family: inherit;">
+    return f"""<form class="contact-form" action="{form_action}" method="POST">
+    <div class="form-field">
+        <label for="name">Navn:</label>
+        <input type="text" id="name" name="name" required>
     </div>
-    <div style="margin-bottom: 1rem;">
-        <label for="email" style="display: block; margin-bottom: 0.5rem; font-weight: bold;">Email:</label>
-        <input type="email" id="email" name="email" required style="width: 100%; padding: 0.5rem; border: 1px solid #ddd; border-radius: 4px; font-family: inherit;">
+    <div class="form-field">
+        <label for="email">Email:</label>
+        <input type="email" id="email" name="email" required>
     </div>
-    <div style="margin-bottom: 1rem;">
-        <label for="subject" style="display: block; margin-bottom: 0.5rem; font-weight: bold;">Emne:</label>
-        <input type="text" id="subject" name="subject" required style="width: 100%; padding: 0.5rem; border: 1px solid #ddd; border-radius: 4px; font-family: inherit;">
+    <div class="form-field">
+        <label for="subject">Emne:</label>
+        <input type="text" id="subject" name="subject" required>
     </div>
-    <div style="margin-bottom: 1rem;">
-        <label for="message" style="display: block; margin-bottom: 0.5rem; font-weight: bold;">Besked:</label>
-        <textarea id="message" name="message" rows="6" required style="width: 100%; padding: 0.5rem; border: 1px solid #ddd; border-radius: 4px; font-family: inherit;"></textarea>
+    <div class="form-field">
+        <label for="message">Besked:</label>
+        <textarea id="message" name="message" rows="6" required></textarea>
     </div>
-    <button type="submit" style="background-color: #1e5a96; color: white; padding: 0.75rem 1.5rem; border: none; border-radius: 4px; font-size: 1rem; cursor: pointer; font-weight: bold;">Send besked</button>
+    <button type="submit">Send besked</button>
 </form>
 <p><small><em>Bemærk: Du skal selv opsætte Formspree-URL'en ovenfor for at aktivere kontaktformularen. Se dokumentation for detaljer.</em></small></p>"""
 
@@ -427,7 +593,7 @@ def render_navbar(pages: dict, root_path: str, is_home: bool) -> str:
     """
     Render the navigation bar.
     
-    pages: dict of all pages organized by category
+    pages: dict of page id → site_model.Page
     root_path: relative path to site root
     is_home: whether this is the home page
     """
@@ -458,7 +624,7 @@ def render_navbar(pages: dict, root_path: str, is_home: bool) -> str:
                         <ul class="dropdown-menu">
 """
         for page_id in sorted(informationer_pages.keys()):
-            title = informationer_pages[page_id].get('title', page_id.split('/')[-1])
+            title = informationer_pages[page_id].title or page_id.split('/')[-1]
             nav += f'                            <li><a href="{root_path}{page_id}/">{title}</a></li>\n'
         nav += """                        </ul>
                     </li>
@@ -480,7 +646,7 @@ def render_navbar(pages: dict, root_path: str, is_home: bool) -> str:
                         <ul class="dropdown-menu">
 """
         for page_id in sorted_dagtilbud:
-            title = dagtilbud_pages[page_id].get('title', page_id.split('/')[-1])
+            title = dagtilbud_pages[page_id].title or page_id.split('/')[-1]
             nav += f'                            <li><a href="{root_path}{page_id}/">{title}</a></li>\n'
         nav += """                        </ul>
                     </li>
@@ -493,7 +659,7 @@ def render_navbar(pages: dict, root_path: str, is_home: bool) -> str:
                         <ul class="dropdown-menu">
 """
         for page_id in sorted(foreninger_pages.keys()):
-            title = foreninger_pages[page_id].get('title', page_id.split('/')[-1])
+            title = foreninger_pages[page_id].title or page_id.split('/')[-1]
             nav += f'                            <li><a href="{root_path}{page_id}/">{title}</a></li>\n'
         nav += """                        </ul>
                     </li>